@@ -34,14 +34,20 @@ import warnings
 warnings.filterwarnings("ignore",
                         message="elementwise comparison failed; returning scalar instead")
 
+# The IPython extension is only imported when running inside IPython
 try:
-    import IPython                 # noqa (API import)
+    if 'IPython' not in sys.modules:
+        raise ImportError('IPython not in use')
     from .ipython import notebook_extension
     extension = notebook_extension # noqa (name remapping)
 except ImportError as e:
     class notebook_extension(param.ParameterizedFunction):
         def __call__(self, *args, **opts): # noqa (dummy signature)
-            raise Exception("IPython notebook not available: use hv.extension instead.")
+            try:
+                from .ipython import notebook_extension
+            except ImportError:
+                raise Exception("IPython notebook not available: use hv.extension instead.")
+            return notebook_extension(*args, **opts)
 
 # A single holoviews.rc file may be executed if found.
 for rcfile in [os.environ.get("HOLOVIEWSRC", ''),
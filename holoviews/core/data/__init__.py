@@ -1,5 +1,8 @@
 from __future__ import absolute_import
 
+import sys
+import types
+
 try:
     import itertools.izip as zip
 except ImportError:
@@ -10,6 +13,7 @@ import param
 
 from ..dimension import redim
 from ..util import dimension_range
+from .. import util
 from .interface import Interface, iloc, ndloc
 from .array import ArrayInterface
 from .dictionary import DictInterface
@@ -30,34 +34,54 @@ except Exception as e:
     param.main.warning('Pandas interface failed to import with '
                        'following error: %s' % e)
 
-try:
-    import iris # noqa (Availability import)
-    from .iris import CubeInterface # noqa (Conditional API import)
-    datatypes.append('cube')
-except ImportError:
-    pass
-except Exception as e:
-    param.main.warning('Iris interface failed to import with '
-                       'following error: %s' % e)
+# Optional interfaces are only imported once their library is in use
+for _datatype, _module, _library in [('cube', 'iris', 'iris'),
+                                     ('xarray', 'xarray', 'xarray'),
+                                     ('dask', 'dask', 'dask.dataframe')]:
+    if util.module_available(_library.split('.')[0]):
+        Interface.register_lazy(_datatype, 'holoviews.core.data.%s' % _module, _library)
+        datatypes.append(_datatype)
 
-try:
-    import xarray # noqa (Availability import)
-    from .xarray import XArrayInterface # noqa (Conditional API import)
-    datatypes.append('xarray')
-except ImportError:
-    pass
+# Optional interfaces formerly imported eagerly, resolved on access
+_lazy_api = {'CubeInterface': 'cube', 'XArrayInterface': 'xarray',
+             'DaskInterface': 'dask'}
 
-try:
-    from .dask import DaskInterface   # noqa (Conditional API import)
-    datatypes.append('dask')
-except ImportError:
-    pass
+class _DataModule(types.ModuleType):
+    """
+    Module type importing the optional interfaces when they are
+    accessed as attributes of this module.
+    """
+
+    def __getattr__(self, name):
+        datatype = _lazy_api.get(name)
+        if datatype is not None:
+            Interface.load([datatype], requested=[datatype])
+            if datatype in Interface.interfaces:
+                return Interface.interfaces[datatype]
+        raise AttributeError("module %r has no attribute %r" % (self.__name__, name))
+
+if sys.version_info >= (3, 5):
+    # Assigning the class of a module is supported since Python 3.5
+    sys.modules[__name__].__class__ = _DataModule
+else:
+    Interface.load(list(_lazy_api.values()), list(_lazy_api.values()))
+    for _name, _datatype in _lazy_api.items():
+        if _datatype in Interface.interfaces:
+            globals()[_name] = Interface.interfaces[_datatype]
 
 from ..dimension import Dimension
 from ..element import Element
 from ..ndmapping import OrderedDict
 from ..spaces import HoloMap, DynamicMap
-from .. import util
+
+
+def _column_token(values):
+    """
+    Identifies the memory backing the values of a DataFrame column,
+    which is stable until the column is replaced.
+    """
+    interface = getattr(values, '__array_interface__', None)
+    return id(values) if interface is None else interface['data'][0]
 
 
 class DataConversion(object):
@@ -184,6 +208,9 @@ class Dataset(Element):
             vdims = [kd if isinstance(kd, Dimension) else Dimension(kd)
                      for kd in kwargs['vdims']]
 
+        # Ranges computed from the data, valid only for the data object
+        self._range_cache = (None, None, {})
+
         initialized = Interface.initialize(type(self), data, kdims, vdims,
                                            datatype=kwargs.get('datatype'))
         (data, self.interface, dims, extra_kws) = initialized
@@ -243,12 +270,70 @@ class Dataset(Element):
         elif all(v is not None and np.isfinite(v) for v in dim.range):
             return dim.range
         elif dim in self.dimensions() and data_range and len(self):
-            lower, upper = self.interface.range(self, dim)
+            lower, upper = self._data_range(dim)
         else:
             lower, upper = (np.NaN, np.NaN)
         return dimension_range(lower, upper, dim)
 
 
+    def _data_range(self, dim):
+        """
+        Computes the range of the data along the supplied dimension,
+        caching the result until the data object is replaced or its
+        version changes. Clones sharing the same data object also
+        share the cache.
+        """
+        data, version, cache = getattr(self, '_range_cache', (None, None, {}))
+        current = self._data_version()
+        if data is not self.data or version != current:
+            cache = {}
+            self._range_cache = (self.data, current, cache)
+        key = (dim.name, self.get_dimension_index(dim))
+        if key not in cache:
+            cache[key] = self.interface.range(self, dim)
+        return cache[key]
+
+
+    def _data_version(self):
+        """
+        Returns a cheap token identifying the state of the data, which
+        changes when columns or rows are added or removed in place or
+        when a column is replaced. Assignments to the values of
+        existing arrays are not detected.
+        """
+        data = self.data
+        if isinstance(data, dict):
+            return tuple((k, id(v), len(v) if isinstance(v, list)
+                          else getattr(v, 'shape', None))
+                         for k, v in data.items())
+        elif util.pd is not None and isinstance(data, util.pd.DataFrame):
+            return (data.shape,) + tuple((c, _column_token(data[c].values))
+                                         for c in data.columns)
+        elif util.is_dataframe(data):
+            # Lazy DataFrames do not have a cheaply computed length
+            return tuple(data.columns)
+        return getattr(data, 'shape', None)
+
+
+    def clone(self, data=None, shared_data=True, new_type=None, *args, **overrides):
+        """
+        Returns a clone of the object with matching parameter values
+        containing the specified args and kwargs.
+
+        If shared_data is set to True and no data explicitly supplied,
+        the clone will share data with the original. May also supply
+        a new_type, which will inherit all shared parameters.
+        """
+        cloned = super(Dataset, self).clone(data, shared_data, new_type,
+                                            *args, **overrides)
+        range_data = getattr(self, '_range_cache', (None, None, {}))[0]
+        if (isinstance(cloned, Dataset) and range_data is self.data
+            and cloned.data is self.data and
+            not any(d in overrides for d in ('kdims', 'vdims'))):
+            cloned._range_cache = self._range_cache
+        return cloned
+
+
     def add_dimension(self, dimension, dim_pos, dim_val, vdim=False, **kwargs):
         """
         Create a new object with an additional key dimensions.  Requires
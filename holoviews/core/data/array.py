@@ -144,15 +144,8 @@ class ArrayInterface(Interface):
                  if kdim not in dimensions]
         vdims = dataset.vdims
 
-        # Find unique entries along supplied dimensions
-        # by creating a view that treats the selected
-        # groupby keys as a single object.
-        indices = data[:, dim_idxs].copy()
-        group_shape = indices.dtype.itemsize * indices.shape[1]
-        view = indices.view(np.dtype((np.void, group_shape)))
-        _, idx = np.unique(view, return_index=True)
-        idx.sort()
-        unique_indices = indices[idx]
+        # Find the unique keys and the sorted group bounds
+        keys, index, bounds = cls.group_indices([data[:, i] for i in dim_idxs])
 
         # Get group
         group_kwargs = {}
@@ -161,22 +154,20 @@ class ArrayInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Iterate over the unique entries building masks
-        # to apply the group selection
+        # Sort the rows by group once and slice out each group
         grouped_data = []
         col_idxs = [dataset.get_dimension_index(d) for d in dataset.dimensions()
                     if d not in dimensions]
-        for group in unique_indices:
-            mask = np.logical_and.reduce([data[:, d_idx] == group[i]
-                                          for i, d_idx in enumerate(dim_idxs)])
-            group_data = data[mask][:, col_idxs]
+        sorted_data = data[index][:, col_idxs]
+        for group, (start, stop) in zip(keys, bounds):
+            group_data = sorted_data[start:stop]
             if not group_type == 'raw':
                 if issubclass(group_type, dict):
                     group_data = {d.name: group_data[:, i] for i, d in
                                   enumerate(kdims+vdims)}
                 else:
                     group_data = group_type(group_data, **group_kwargs)
-            grouped_data.append((tuple(group), group_data))
+            grouped_data.append((group, group_data))
 
         if issubclass(container_type, NdMapping):
             with item_check(False):
@@ -224,8 +215,18 @@ class ArrayInterface(Interface):
     @classmethod
     def aggregate(cls, dataset, dimensions, function, **kwargs):
         reindexed = dataset.reindex(dimensions)
-        grouped = (cls.groupby(reindexed, dimensions, list, 'raw')
-                   if len(dimensions) else [((), reindexed.data)])
+        if len(dimensions):
+            # Attempt to reduce all groups at once
+            data, ndims = reindexed.data, len(dimensions)
+            keys, index, bounds = cls.group_indices([data[:, i] for i in range(ndims)])
+            values = data[index, ndims:]
+            reduced = cls.reduce_groups(values, bounds, function, **kwargs)
+            if reduced is not None:
+                return np.column_stack([np.array(keys), reduced])
+            # Reduce each group of the already sorted rows
+            grouped = [(k, values[start:stop]) for k, (start, stop) in zip(keys, bounds)]
+        else:
+            grouped = [((), reindexed.data)]
 
         rows = []
         for k, group in grouped:
@@ -42,6 +42,8 @@ class DictInterface(Interface):
 
         dimensions = [d.name if isinstance(d, Dimension) else
                       d for d in kdims + vdims]
+        # Import interfaces whose library is in use so their types are known
+        cls.load(list(cls.lazy_interfaces))
         if isinstance(data, tuple):
             data = {d: v for d, v in zip(dimensions, data)}
         elif util.is_dataframe(data) and all(d in data for d in dimensions):
@@ -203,15 +205,15 @@ class DictInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Find all the keys along supplied dimensions
-        keys = [tuple(dataset.data[d.name][i] for d in dimensions)
-                for i in range(len(dataset))]
+        # Find the unique keys and the sorted group bounds
+        keys, index, bounds = cls.group_indices([cls.values(dataset, d)
+                                                 for d in dimensions])
 
-        # Iterate over the unique entries applying selection masks
+        # Sort the columns by group once and slice out each group
         grouped_data = []
-        for unique_key in util.unique_iterator(keys):
-            mask = cls.select_mask(dataset, dict(zip(dimensions, unique_key)))
-            group_data = OrderedDict(((d.name, dataset[d.name][mask]) for d in kdims+vdims))
+        columns = [(d.name, cls.values(dataset, d)[index]) for d in kdims+vdims]
+        for unique_key, (start, stop) in zip(keys, bounds):
+            group_data = OrderedDict((name, col[start:stop]) for name, col in columns)
             group_data = group_type(group_data, **group_kwargs)
             grouped_data.append((unique_key, group_data))
 
@@ -252,20 +254,24 @@ class DictInterface(Interface):
     def aggregate(cls, dataset, kdims, function, **kwargs):
         kdims = [dataset.get_dimension(d, strict=True).name for d in kdims]
         vdims = dataset.dimensions('value', label='name')
-        groups = cls.groupby(dataset, kdims, list, OrderedDict)
-        aggregated = OrderedDict([(k, []) for k in kdims+vdims])
-
-        for key, group in groups:
-            key = key if isinstance(key, tuple) else (key,)
-            for kdim, val in zip(kdims, key):
-                aggregated[kdim].append(val)
-            for vdim, arr in group.items():
-                if vdim in dataset.vdims:
+
+        # Attempt to reduce all groups at once
+        keys, index, bounds = cls.group_indices([cls.values(dataset, d) for d in kdims])
+        columns = [(vd, cls.values(dataset, vd)[index]) for vd in vdims]
+        aggregated = OrderedDict([(kd, np.array([k[i] for k in keys]))
+                                  for i, kd in enumerate(kdims)])
+        for vdim, values in columns:
+            reduced = cls.reduce_groups(values, bounds, function, **kwargs)
+            if reduced is None:
+                # Reduce each group of the already sorted column
+                reduced = []
+                for start, stop in bounds:
+                    arr = values[start:stop]
                     if isinstance(function, np.ufunc):
-                        reduced = function.reduce(arr, **kwargs)
+                        reduced.append(function.reduce(arr, **kwargs))
                     else:
-                        reduced = function(arr, **kwargs)
-                    aggregated[vdim].append(reduced)
+                        reduced.append(function(arr, **kwargs))
+            aggregated[vdim] = reduced
         return aggregated
 
 
@@ -287,10 +287,7 @@ class GridInterface(DictInterface):
             if mask is True:
                 mask = np.ones(values.shape, dtype=np.bool)
         elif isinstance(ind, (set, list)):
-            iter_slcs = []
-            for ik in ind:
-                iter_slcs.append(values == ik)
-            mask = np.logical_or.reduce(iter_slcs)
+            mask = cls.isin(values, ind)
         elif callable(ind):
             mask = ind(values)
         elif ind is None:
@@ -1,3 +1,6 @@
+import sys
+import importlib
+
 import param
 import numpy as np
 
@@ -46,6 +49,7 @@ class iloc(object):
             kdims = [d for d in dims if d in kdims]
             vdims = [d for d in dims if d in vdims]
 
+        Interface.load(self.dataset.datatype)
         datatype = [dt for dt in self.dataset.datatype
                     if dt in Interface.interfaces and
                     not Interface.interfaces[dt].gridded]
@@ -84,15 +88,59 @@ class Interface(param.Parameterized):
 
     interfaces = {}
 
+    # Optional interfaces imported on first use, mapping from the
+    # datatype to the defining module and the library it wraps
+    lazy_interfaces = {}
+
     datatype = None
 
     gridded = False
 
+    # Reductions which may be applied to all groups at once
+    segment_reductions = {np.sum: 'sum', np.add: 'sum', np.mean: 'mean',
+                          np.min: 'min', np.minimum: 'min', np.max: 'max',
+                          np.maximum: 'max', np.std: 'std', np.var: 'var',
+                          np.size: 'count', len: 'count'}
+
     @classmethod
     def register(cls, interface):
         cls.interfaces[interface.datatype] = interface
 
 
+    @classmethod
+    def register_lazy(cls, datatype, module, library):
+        """
+        Registers an interface defined in the supplied module, which
+        is only imported once the library it wraps has been imported
+        or the datatype is explicitly requested.
+        """
+        if datatype not in cls.interfaces:
+            cls.lazy_interfaces[datatype] = (module, library)
+
+
+    @classmethod
+    def load(cls, datatypes, requested=[]):
+        """
+        Imports the lazily registered interfaces for the supplied
+        datatypes whose library has already been imported, or which
+        are listed in the requested datatypes.
+        """
+        for datatype in datatypes:
+            if datatype in cls.interfaces or datatype not in cls.lazy_interfaces:
+                continue
+            module, library = cls.lazy_interfaces[datatype]
+            if library not in sys.modules and datatype not in requested:
+                continue
+            cls.lazy_interfaces.pop(datatype)
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                pass
+            except Exception as e:
+                param.main.warning('%s interface failed to import with '
+                                   'following error: %s' % (datatype, e))
+
+
     @classmethod
     def cast(cls, dataset, datatype=None, cast_type=None):
         """
@@ -145,7 +193,9 @@ class Interface(param.Parameterized):
         elif isinstance(data, util.generator_types):
             data = list(data)
 
-        # Set interface priority order
+        # Set interface priority order, importing optional interfaces
+        # if their library is in use or they are the preferred datatype
+        cls.load(datatype, datatype[:1])
         prioritized = [cls.interfaces[p] for p in datatype
                        if p in cls.interfaces]
         head = [intfc for intfc in prioritized if type(data) in intfc.types]
@@ -182,6 +232,143 @@ class Interface(param.Parameterized):
         return not any(array.shape not in [arrays[0].shape, (1,)] for array in arrays[1:])
 
 
+    @classmethod
+    def factorize(cls, values):
+        """
+        Given an array of values returns an integer array of codes
+        which are identical for equal values.
+        """
+        try:
+            return np.unique(values, return_inverse=True)[1]
+        except TypeError:
+            # Unorderable objects cannot be sorted by NumPy
+            codes = {}
+            return np.array([codes.setdefault(v, len(codes)) for v in values],
+                            dtype=np.int64)
+
+
+    @classmethod
+    def group_indices(cls, columns):
+        """
+        Given a list of equal length columns, groups the rows with
+        identical values across all columns in a single pass, using a
+        stable sort over the combined integer codes of each column.
+        Returns a list of the unique keys in the order they first
+        occur, an index array sorting the rows by group (preserving
+        their order within each group) and the list of (start, stop)
+        bounds of each group in the sorted rows. If no columns are
+        supplied all rows are returned as a single group with an empty
+        key and the sort index is an empty slice. Indexing each column
+        with the sort index therefore allows splitting it into groups
+        without copying any further data.
+        """
+        if not len(columns):
+            return [()], slice(None), [(0, None)]
+        elif not len(columns[0]):
+            return [], np.array([], dtype=np.int64), []
+        codes = [cls.factorize(np.asarray(col)) for col in columns]
+        if len(codes) == 1:
+            inverse = codes[0]
+        else:
+            stacked = np.ascontiguousarray(np.column_stack(codes))
+            view = stacked.view(np.dtype((np.void, stacked.dtype.itemsize*stacked.shape[1])))
+            inverse = np.unique(view.ravel(), return_inverse=True)[1]
+        order = np.argsort(inverse, kind='mergesort')
+        sorted_codes = inverse[order]
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(sorted_codes))+1])
+        stops = np.concatenate([starts[1:], [len(order)]])
+
+        # Order groups by their first occurrence
+        first = order[starts]
+        group_order = np.argsort(first, kind='mergesort')
+        keys = [tuple(col[i] for col in columns) for i in first[group_order]]
+        bounds = list(zip(starts[group_order], stops[group_order]))
+        return keys, order, bounds
+
+
+    @classmethod
+    def reduce_groups(cls, values, bounds, function, **kwargs):
+        """
+        Applies a NumPy reduction to all groups of the supplied values
+        at once, where the values have been sorted by group and the
+        bounds are the (start, stop) bounds of each group, as returned
+        by group_indices. The reduction is applied along the first
+        axis using ufunc.reduceat over the group boundaries. Returns
+        None if the function or the dtype of the values is not
+        supported, in which case the groups have to be reduced
+        individually.
+        """
+        try:
+            reduction = cls.segment_reductions.get(function)
+        except TypeError:
+            return None
+        allowed = ['ddof'] if reduction in ['std', 'var'] else []
+        values = np.asarray(values)
+        if (reduction is None or any(k not in allowed for k in kwargs)
+            or values.dtype.kind not in 'biuf' or not len(values)):
+            return None
+
+        starts = np.array([start for start, _ in bounds])
+        stops = np.array([len(values) if stop is None else stop for _, stop in bounds])
+        order = np.argsort(starts)
+        starts, counts = starts[order], (stops-starts)[order]
+        if values.dtype.kind == 'b':
+            values = values.astype(np.int64)
+        shape = (len(counts),)+(1,)*(values.ndim-1)
+
+        if reduction == 'count':
+            reduced = np.broadcast_to(counts.reshape(shape),
+                                      (len(counts),)+values.shape[1:])
+        elif reduction == 'sum':
+            reduced = np.add.reduceat(values, starts, axis=0)
+        elif reduction == 'min':
+            reduced = np.minimum.reduceat(values, starts, axis=0)
+        elif reduction == 'max':
+            reduced = np.maximum.reduceat(values, starts, axis=0)
+        else:
+            reduced = np.add.reduceat(values, starts, axis=0)/counts.reshape(shape)
+            if reduction in ['std', 'var']:
+                deviation = values - np.repeat(reduced, counts, axis=0)
+                ddof = kwargs.get('ddof', 0)
+                reduced = (np.add.reduceat(deviation**2, starts, axis=0) /
+                           (counts-ddof).reshape(shape))
+                if reduction == 'std':
+                    reduced = np.sqrt(reduced)
+
+        # Restore the order of the supplied bounds
+        ordered = np.empty_like(reduced)
+        ordered[order] = reduced
+        return ordered
+
+
+    @classmethod
+    def isin(cls, values, keys):
+        """
+        Returns a boolean mask of the supplied array of values which
+        is True where the value matches one of the keys, computed in
+        a single pass. Numeric data is matched using np.in1d, while
+        strings and objects are looked up in a hash table.
+        """
+        values = np.asarray(values)
+        keys = list(keys)
+        if not keys:
+            return np.zeros(values.shape, dtype=np.bool)
+        key_array = np.asarray(keys)
+        if values.dtype.kind in 'biuf' and key_array.dtype.kind in 'biuf':
+            return np.in1d(values.ravel(), key_array).reshape(values.shape)
+        elif values.dtype.kind in 'OSU':
+            try:
+                if util.pd:
+                    mask = util.pd.Series(values.ravel()).isin(keys).values
+                else:
+                    keyset = set(keys)
+                    mask = np.array([v in keyset for v in values.ravel()], dtype=np.bool)
+                return mask.reshape(values.shape)
+            except TypeError:
+                pass
+        return np.logical_or.reduce([values == k for k in keys])
+
+
     @classmethod
     def select_mask(cls, dataset, selection):
         """
@@ -201,10 +388,7 @@ class Interface(param.Parameterized):
                 if k.stop is not None:
                     mask &= arr < k.stop
             elif isinstance(k, (set, list)):
-                iter_slcs = []
-                for ik in k:
-                    iter_slcs.append(arr == ik)
-                mask &= np.logical_or.reduce(iter_slcs)
+                mask &= cls.isin(arr, k)
             elif callable(k):
                 mask &= k(arr)
             else:
@@ -257,6 +441,7 @@ class Interface(param.Parameterized):
         if len(interfaces)!=1 and datatype is None:
             raise Exception("Please specify the concatenated datatype")
         elif len(interfaces)!=1:
+            cls.load([datatype], [datatype])
             interface = cls.interfaces[datatype]
         else:
             interface = interfaces.pop()
@@ -687,6 +687,7 @@ class LabelledData(param.Parameterized):
                         if backend not in Store._custom_options:
                             Store._custom_options[backend] = {}
                         Store._custom_options[backend][Store.load_counter_offset + custom_id] = info
+                        Store.options_version += 1
 
                     d.pop(match)
 
@@ -4,6 +4,7 @@ map types. The former class only allows indexing whereas the latter
 also enables slicing over multiple dimension ranges.
 """
 
+import numbers
 from itertools import cycle
 from operator import itemgetter
 import numpy as np
@@ -95,6 +96,23 @@ class MultiDimensionalMapping(Dimensioned):
     _deep_indexable = False
     _check_items = True
 
+    @property
+    def data(self):
+        """
+        The OrderedDict of items. Sorting of items added since the data
+        was last accessed is deferred until the data is accessed,
+        ensuring that adding items one at a time remains cheap.
+        """
+        if self._unsorted:
+            self._resort()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._unsorted = False
+        self._key_index = None
+
     def __init__(self, initial_items=None, **params):
         if isinstance(initial_items, MultiDimensionalMapping):
             params = dict(util.get_param_values(initial_items),
@@ -174,14 +192,16 @@ class MultiDimensionalMapping(Dimensioned):
                                ' specified dimension values.' % (dim, repr(val)))
 
         # Updates nested data structures rather than simply overriding them.
-        if (update and (dim_vals in self.data)
-            and isinstance(self.data[dim_vals], (MultiDimensionalMapping, OrderedDict))):
-            self.data[dim_vals].update(data)
+        if (update and (dim_vals in self._data)
+            and isinstance(self._data[dim_vals], (MultiDimensionalMapping, OrderedDict))):
+            self._data[dim_vals].update(data)
         else:
-            self.data[dim_vals] = data
+            self._data[dim_vals] = data
 
+        # Defer sorting until the data is next accessed
         if sort:
-            self._resort()
+            self._unsorted = True
+        self._key_index = None
 
 
     def _apply_key_type(self, keys):
@@ -249,7 +269,7 @@ class MultiDimensionalMapping(Dimensioned):
 
 
     def _resort(self):
-        resorted = dimension_sort(self.data, self.kdims, self.vdims,
+        resorted = dimension_sort(self._data, self.kdims, self.vdims,
                                   self._cached_categorical,
                                   range(self.ndims),
                                   self._cached_index_values)
@@ -477,7 +497,7 @@ class MultiDimensionalMapping(Dimensioned):
         for key, data in other.items():
             self._add_item(key, data, sort=False)
         if self.sort:
-            self._resort()
+            self._unsorted = True
 
 
     def keys(self):
@@ -511,7 +531,8 @@ class MultiDimensionalMapping(Dimensioned):
     def pop(self, key, default=None):
         "Standard pop semantics for all mapping types"
         if not isinstance(key, tuple): key = (key,)
-        return self.data.pop(key, default)
+        self._key_index = None
+        return self._data.pop(key, default)
 
 
     def __getitem__(self, key):
@@ -545,7 +566,30 @@ class MultiDimensionalMapping(Dimensioned):
             return key in self.keys()
 
     def __len__(self):
-        return len(self.data)
+        return len(self._data)
+
+
+    def __getstate__(self):
+        """
+        Ensures the data is sorted before pickling and stored under
+        the data attribute.
+        """
+        obj_dict = super(MultiDimensionalMapping, self).__getstate__()
+        obj_dict['data'] = self.data
+        obj_dict.pop('_data', None)
+        obj_dict.pop('_unsorted', None)
+        obj_dict.pop('_key_index', None)
+        return obj_dict
+
+
+    def __setstate__(self, d):
+        """
+        Restores the data from pickles where it is stored under the
+        data attribute.
+        """
+        data = d.pop('data', OrderedDict())
+        super(MultiDimensionalMapping, self).__setstate__(d)
+        self.data = data
 
 
 
@@ -591,8 +635,24 @@ class NdMapping(MultiDimensionalMapping):
             return self._dataslice(self.data[map_slice], data_slice)
         else:
             conditions = self._generate_conditions(map_slice)
-            items = self.data.items()
+            unindexed = []
+            positions = None
             for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
+                selected = self._index_selection(cidx, map_slice[cidx])
+                if selected is None:
+                    unindexed.append((cidx, condition, dim))
+                elif selected is Ellipsis:
+                    continue
+                elif positions is None:
+                    positions = selected
+                else:
+                    positions = np.intersect1d(positions, selected, assume_unique=True)
+            if positions is None:
+                items = list(self.data.items())
+            else:
+                keys = self._get_key_index()[0]
+                items = [(keys[i], self.data[keys[i]]) for i in np.sort(positions)]
+            for cidx, condition, dim in unindexed:
                 values = self._cached_index_values.get(dim.name, None)
                 items = [(k, v) for k, v in items
                          if condition(values.index(k[cidx])
@@ -608,14 +668,116 @@ class NdMapping(MultiDimensionalMapping):
                 return self.clone(sliced_items)
 
 
+    def _get_key_index(self):
+        """
+        Returns the list of keys along with a sorted index of the keys
+        along each key dimension, built lazily and discarded whenever
+        the items change. Each index is a tuple of the key positions
+        in sorted order and the sorted key values, or None if the keys
+        along that dimension cannot be indexed.
+        """
+        if self._key_index is None or len(self._key_index[0]) != len(self._data):
+            keys = list(self.data.keys())
+            self._key_index = (keys, [self._build_dim_index(dim, [k[i] for k in keys])
+                                      for i, dim in enumerate(self.kdims)])
+        return self._key_index
+
+
+    def _build_dim_index(self, dim, keys):
+        """
+        Builds a sorted index of the supplied keys along a dimension.
+        Numeric keys are indexed as floats and strings as objects,
+        while keys of any other type are not indexed. Keys along
+        dimensions declaring values are indexed by their position in
+        the declared values.
+        """
+        values = self._cached_index_values.get(dim.name)
+        try:
+            if values:
+                lookup = {}
+                for i, v in enumerate(values):
+                    lookup.setdefault(v, i)
+                keys = [lookup[k] for k in keys]
+            if all(isinstance(k, basestring) for k in keys):
+                arr = np.array(keys, dtype=object)
+            elif all(isinstance(k, (numbers.Number, np.number)) for k in keys):
+                arr = np.asarray(keys)
+                if arr.dtype.kind not in 'biuf':
+                    return None
+                elif arr.dtype.kind in 'iu' and len(arr) and np.abs(arr).max() > 2**53:
+                    return None
+                arr = arr.astype('float64')
+                if np.isnan(arr).any():
+                    return None
+            else:
+                return None
+            order = np.argsort(arr, kind='mergesort')
+        except (KeyError, TypeError, ValueError):
+            return None
+        return order, arr[order]
+
+
+    def _index_selection(self, dim_idx, dim_slice):
+        """
+        Uses the sorted key index along the specified dimension to
+        resolve a slice, set, list or scalar selection into an array
+        of selected item positions. Returns Ellipsis if the selection
+        includes all items and None if the selection cannot be
+        resolved using the index.
+        """
+        if dim_slice is Ellipsis or (isinstance(dim_slice, slice) and
+                                     dim_slice == slice(None)):
+            return Ellipsis
+        elif callable(dim_slice):
+            return None
+        index = self._get_key_index()[1][dim_idx]
+        if index is None:
+            return None
+        order, sorted_keys = index
+        dim = self.kdims[dim_idx]
+        values = self._cached_index_values.get(dim.name)
+        to_index = (values.index if values else lambda v: v)
+
+        numeric = sorted_keys.dtype.kind == 'f'
+        def valid(v):
+            if numeric:
+                return isinstance(v, (numbers.Number, np.number))
+            return isinstance(v, basestring)
+
+        try:
+            if isinstance(dim_slice, slice):
+                start, stop = dim_slice.start, dim_slice.stop
+                start = None if start is None else to_index(start)
+                stop = None if stop is None else to_index(stop)
+                if not all(valid(v) for v in (start, stop) if v is not None):
+                    return None
+                lower = 0 if start is None else sorted_keys.searchsorted(start, 'left')
+                upper = len(order) if stop is None else sorted_keys.searchsorted(stop, 'left')
+                return order[lower:max(lower, upper)]
+            elif isinstance(dim_slice, (set, list)):
+                selection = [to_index(v) for v in dim_slice]
+            else:
+                selection = [to_index(dim_slice)]
+            if not all(valid(v) for v in selection):
+                return None
+            selected = [order[sorted_keys.searchsorted(v, 'left'):
+                              sorted_keys.searchsorted(v, 'right')]
+                        for v in selection]
+        except (TypeError, ValueError):
+            return None
+        if not selected:
+            return np.array([], dtype=order.dtype)
+        return np.unique(np.concatenate(selected))
+
+
     def _expand_slice(self, indices):
         """
         Expands slices containing steps into a list.
         """
-        keys = list(self.data.keys())
         expanded = []
         for idx, ind in enumerate(indices):
             if isinstance(ind, slice) and ind.step is not None:
+                keys = list(self.data.keys())
                 dim_ind = slice(ind.start, ind.stop)
                 if dim_ind == slice(None):
                     condition = self._all_condition()
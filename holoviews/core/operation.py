@@ -61,6 +61,18 @@ class Operation(param.ParameterizedFunction):
         List of streams that are applied if dynamic=True, allowing
         for dynamic interaction with the plot.""")
 
+    executor = param.Parameter(default='serial', doc="""
+        How the elements of a HoloMap are processed, either 'serial',
+        'threads' or 'processes' to use a concurrent.futures thread
+        or process pool or a user supplied concurrent.futures.Executor.
+        Results are returned in key order and an exception raised for
+        any key is propagated for the first failing key.""")
+
+    max_workers = param.Integer(default=None, allow_None=True, doc="""
+        The maximum number of workers used by the 'threads' and
+        'processes' executors, defaults to the concurrent.futures
+        default.""")
+
     @classmethod
     def search(cls, element, pattern):
         """
@@ -121,6 +133,54 @@ class Operation(param.ParameterizedFunction):
         return self._process(element, key)
 
 
+    def _process_items(self, items, params):
+        """
+        Processes a list of (key, element) items using the selected
+        executor, returning the processed items in key order.
+        """
+        executor = self.p.executor
+        if executor == 'serial' or len(items) < 2:
+            return [(k, self._process(el, key=k)) for k, el in items]
+
+        try:
+            from concurrent.futures import (Executor, ThreadPoolExecutor,
+                                            ProcessPoolExecutor)
+        except ImportError:
+            raise ImportError("Operation executor %r requires the concurrent.futures "
+                              "module, which may be installed on Python 2 as the "
+                              "futures package." % executor)
+        if isinstance(executor, Executor):
+            return self._submit_items(executor, items, params)
+        elif executor not in ['threads', 'processes']:
+            raise ValueError("Operation executor must be one of 'serial', "
+                             "'threads', 'processes' or a concurrent.futures "
+                             "Executor, found %r." % executor)
+        pool = ThreadPoolExecutor if executor == 'threads' else ProcessPoolExecutor
+        with pool(self.p.max_workers) as executor:
+            return self._submit_items(executor, items, params)
+
+
+    def _submit_items(self, executor, items, params):
+        """
+        Submits the items to the executor. Operations sent to other
+        processes are copied and apply the params themselves, while
+        other executors share the already computed params, which
+        must not be reassigned concurrently.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        if isinstance(executor, ProcessPoolExecutor):
+            futures = [(k, executor.submit(_process_element, self, el, k, params))
+                       for k, el in items]
+        else:
+            futures = [(k, executor.submit(self._process, el, k))
+                       for k, el in items]
+        try:
+            return [(k, future.result()) for k, future in futures]
+        finally:
+            for _, future in futures:
+                future.cancel()
+
+
     def __call__(self, element, **params):
         self.p = param.ParamOverrides(self, params)
         dynamic = ((self.p.dynamic == 'default' and
@@ -147,14 +207,21 @@ class Operation(param.ParameterizedFunction):
             samples = tuple(d.values for d in element.kdims)
             processed = self(element[samples], **params)
         elif isinstance(element, HoloMap):
-            mapped_items = [(k, self._process(el, key=k))
-                            for k, el in element.items()]
+            mapped_items = self._process_items(list(element.items()), params)
             processed = element.clone(mapped_items)
         else:
             raise ValueError("Cannot process type %r" % type(element).__name__)
         return processed
 
 
+def _process_element(operation, element, key, params):
+    """
+    Applies the operation to a single element, defined at the module
+    level so it may be submitted to a process pool.
+    """
+    return operation.process_element(element, key, **params)
+
+
 class ElementOperation(Operation):
 
     def __init__(self, *args, **kwargs):
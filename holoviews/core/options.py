@@ -537,6 +537,8 @@ class OptionTree(AttrTree):
         _groups = {g:Options() for g in groups} if isinstance(groups, list) else groups
 
         self.__dict__['groups'] = _groups
+        self.__dict__['_closest_cache'] = (None, {})
+        self.__dict__['_cache_stats'] = dict(hits=0, misses=0)
         self.__dict__['_instantiated'] = False
         AttrTree.__init__(self, items, identifier, parent)
         self.__dict__['_instantiated'] = True
@@ -637,6 +639,7 @@ class OptionTree(AttrTree):
             raise ValueError('OptionTree only accepts a dictionary of Options.')
 
         super(OptionTree, self).__setattr__(identifier, new_node)
+        Store.options_version += 1
 
         if isinstance(val, OptionTree):
             for subtree in val:
@@ -673,12 +676,39 @@ class OptionTree(AttrTree):
 
         In addition, closest supports custom options by checking the
         object
+
+        Resolved Options are cached by path and group until any
+        OptionTree or custom tree is modified (see cache_stats).
         """
         components = (obj.__class__.__name__,
                       group_sanitizer(obj.group),
                       label_sanitizer(obj.label))
+        version, cache = self.__dict__.get('_closest_cache', (None, {}))
+        if version != Store.options_version:
+            cache = {}
+            self.__dict__['_closest_cache'] = (Store.options_version, cache)
+        stats = self.__dict__.setdefault('_cache_stats', dict(hits=0, misses=0))
+        key = (components, group)
+        if key in cache:
+            stats['hits'] += 1
+            return cache[key]
+        stats['misses'] += 1
         target = '.'.join([c for c in components if c])
-        return self.find(components).options(group, target=target)
+        options = self.find(components).options(group, target=target)
+        cache[key] = options
+        return options
+
+
+    @property
+    def cache_stats(self):
+        """
+        Returns a dictionary reporting the number of hits and misses
+        of the closest lookup cache along with the number of
+        currently cached entries.
+        """
+        _, cache = self.__dict__.get('_closest_cache', (None, {}))
+        stats = self.__dict__.get('_cache_stats', dict(hits=0, misses=0))
+        return dict(stats, size=len(cache))
 
 
 
@@ -978,6 +1008,11 @@ class Store(object):
 
     # A dictionary of custom OptionTree by custom object id by backend
     _custom_options = {'matplotlib':{}}
+
+    # Counter incremented whenever any OptionTree or custom tree
+    # mapping changes, allowing option lookups to be memoized
+    options_version = 0
+
     load_counter_offset = None
     save_option_state = False
 
@@ -990,6 +1025,7 @@ class Store(object):
             return cls._options[backend]
         else:
             cls._options[backend] = val
+            cls.options_version += 1
 
     @classmethod
     def loaded_backends(cls):
@@ -1006,6 +1042,7 @@ class Store(object):
             return cls._custom_options[backend]
         else:
             cls._custom_options[backend] = val
+            cls.options_version += 1
 
     @classmethod
     def load(cls, filename):
@@ -1470,6 +1507,7 @@ class StoreOptions(object):
             for key in current_custom_keys.difference(original_custom_keys):
                 del Store.custom_options()[key]
                 cls.restore_ids(obj, ids)
+            Store.options_version += 1
 
     @classmethod
     @contextmanager
@@ -1520,6 +1558,7 @@ class StoreOptions(object):
         """
         # Update the custom option entries for the current backend
         Store.custom_options().update(custom_trees)
+        Store.options_version += 1
         # Update the entries in other backends so the ids match correctly
         for backend in [k for k in Store.renderers.keys() if k != Store.current_backend]:
             for (old_id, new_id) in id_mapping:
@@ -1,4 +1,5 @@
 import itertools
+import threading
 import types
 from numbers import Number
 from itertools import groupby
@@ -15,7 +16,7 @@ from .layout import Layout, AdjointLayout, NdLayout
 from .ndmapping import UniformNdMapping, NdMapping, item_check
 from .overlay import Overlay, CompositeOverlay, NdOverlay, Overlayable
 from .options import Store, StoreOptions
-from ..streams import Stream
+from ..streams import Stream, triggering_streams
 
 
 
@@ -394,6 +395,35 @@ class HoloMap(UniformNdMapping, Overlayable):
                 return histmaps[0]
 
 
+# Per thread stack of flags tracking the evaluations in progress
+_stale_state = threading.local()
+
+@contextmanager
+def _track_stale():
+    """
+    Tracks whether an asynchronous DynamicMap evaluated within the
+    context on the current thread returned a stale element, yielding
+    a list whose only item is set to True if it did.
+    """
+    stack = _stale_state.__dict__.setdefault('stack', [])
+    stale = [False]
+    stack.append(stale)
+    try:
+        yield stale
+    finally:
+        stack.pop()
+
+
+def _mark_stale():
+    """
+    Marks all evaluations in progress on the current thread as
+    depending on a stale element.
+    """
+    for stale in getattr(_stale_state, 'stack', []):
+        stale[0] = True
+
+
+
 class Callable(param.Parameterized):
     """
     Callable allows wrapping callbacks on one or more DynamicMaps
@@ -403,11 +433,13 @@ class Callable(param.Parameterized):
     to a DynamicMap.
 
     Additionally, if the memoize attribute is True, a Callable will
-    memoize the last returned value based on the arguments to the
-    function and the state of all streams on its inputs, to avoid
-    calling the function unnecessarily. Note that because memoization
-    includes the streams found on the inputs it may be disabled if the
-    stream requires it and is triggering.
+    memoize the most recently returned values (up to memoize_size)
+    based on the arguments to the function and the state of all
+    streams on its inputs, to avoid calling the function
+    unnecessarily. Note that because memoization includes the streams
+    found on the inputs it may be disabled if the stream requires it
+    and is triggering. Clones of a Callable wrapping the same function
+    share the memoized values.
 
     A Callable may also specify a stream_mapping which specifies the
     objects that are associated with interactive (i.e linked) streams
@@ -449,6 +481,12 @@ class Callable(param.Parameterized):
          based on the call arguments and any streams attached to the
          inputs.""")
 
+    memoize_size = param.Integer(default=1, bounds=(1, None), doc="""
+         The number of return values that are memoized, once the
+         limit is reached the least recently used value is discarded.
+         Increasing the size avoids recomputation when toggling
+         between a small number of argument and stream states.""")
+
     stream_mapping = param.Dict(default={}, constant=True, doc="""
          Defines how streams should be mapped to objects returned by
          the Callable, e.g. when it returns a Layout.""")
@@ -456,7 +494,7 @@ class Callable(param.Parameterized):
     def __init__(self, callable, **params):
         super(Callable, self).__init__(callable=callable,
                                        **dict(params, name=util.callable_name(callable)))
-        self._memoized = {}
+        self._memoized = OrderedDict()
         self._is_overlay = False
         self.args = None
         self.kwargs = None
@@ -471,35 +509,78 @@ class Callable(param.Parameterized):
         noargs = ArgSpec(args=[], varargs=None, keywords=None, defaults=None)
         return self.argspec == noargs
 
+    @property
+    def coroutine(self):
+        "Returns True if the callable is a coroutine function"
+        return util.iscoroutinefunction(self.callable)
+
 
     def clone(self, callable=None, **overrides):
         """
         Allows making a copy of the Callable optionally overriding
-        the callable and other parameters.
+        the callable and other parameters. Unless a new callable is
+        supplied the clone shares the memoized values.
         """
         old = {k: v for k, v in self.get_param_values()
                if k not in ['callable', 'name']}
         params = dict(old, **overrides)
+        shared_memo = callable is None or callable is self.callable
         callable = self.callable if callable is None else callable
-        return self.__class__(callable, **params)
+        clone = self.__class__(callable, **params)
+        if shared_memo:
+            clone._memoized = self._memoized
+        return clone
+
+
+    def _hash_kwargs(self, kwargs, streams):
+        """
+        Substitutes keyword values supplied by the streams with the
+        corresponding stream hashkey values, avoiding hashing stream
+        values which are compared by reference.
+        """
+        hashed = dict(kwargs)
+        for stream in streams:
+            contents = stream.contents
+            for k, v in stream.hashkey.items():
+                if k in hashed and hashed[k] is contents.get(k):
+                    hashed[k] = v
+        return hashed
 
 
     def __call__(self, *args, **kwargs):
-        # Nothing to do for callbacks that accept no arguments
         (self.args, self.kwargs) = (args, kwargs)
+        return self._call(args, kwargs)
+
+
+    def _call(self, args, kwargs, memoize=None, streams=[]):
+        """
+        Invokes the callable with the supplied arguments. Unless
+        explicitly overridden, whether a memoized value may be returned
+        depends on the memoize parameter and the state of the streams.
+        The streams of the DynamicMap owning the Callable may be
+        supplied so their hashkeys are used to compute memoization keys.
+        Unlike calling the Callable, the args and kwargs attributes are
+        not updated, so it may be invoked concurrently on other threads.
+        """
+        # Nothing to do for callbacks that accept no arguments
         if not args and not kwargs: return self.callable()
+        invoked = (args, kwargs)
         inputs = [i for i in self.inputs if isinstance(i, DynamicMap)]
-        streams = []
-        for stream in [s for i in inputs for s in get_nested_streams(i)]:
+        dmap_streams, streams = streams, []
+        for stream in list(dmap_streams)+[s for i in inputs for s in get_nested_streams(i)]:
             if stream not in streams: streams.append(stream)
 
-        memoize = self.memoize and not any(s.transient and s._triggering for s in streams)
-        values = tuple(tuple(sorted(s.contents.items())) for s in streams)
-        key = args + tuple(sorted(kwargs.items())) + values
+        if memoize is None:
+            memoize = self.memoize and not any(s.transient and s._triggering
+                                               for s in streams)
+        values = tuple(tuple(sorted(s.hashkey.items())) for s in streams)
+        key = args + tuple(sorted(self._hash_kwargs(kwargs, streams).items())) + values
 
         hashed_key = util.deephash(key)
         if memoize and hashed_key in self._memoized:
-            return self._memoized[hashed_key]
+            ret = self._memoized.pop(hashed_key)
+            self._memoized[hashed_key] = ret
+            return ret
 
         if self.argspec.varargs is not None:
             # Missing information on positional argument names, cannot promote to keywords
@@ -517,14 +598,15 @@ class Callable(param.Parameterized):
             args, kwargs = (), dict(pos_kwargs, **kwargs)
 
         try:
-            ret = self.callable(*args, **kwargs)
+            with _track_stale() as stale:
+                ret = self.callable(*args, **kwargs)
         except KeyError:
             # KeyError is caught separately because it is used to signal
             # invalid keys on DynamicMap and should not warn
             raise
         except:
-            posstr = ', '.join(['%r' % el for el in self.args]) if self.args else ''
-            kwstr = ', '.join('%s=%r' % (k,v) for k,v in self.kwargs.items())
+            posstr = ', '.join(['%r' % el for el in invoked[0]])
+            kwstr = ', '.join('%s=%r' % (k,v) for k,v in invoked[1].items())
             argstr = ', '.join([el for el in [posstr, kwstr] if el])
             message = ("Exception raised in callable '{name}' of type '{ctype}'.\n"
                        "Invoked as {name}({argstr})")
@@ -533,8 +615,13 @@ class Callable(param.Parameterized):
                                         argstr=argstr))
             raise
 
-        if hashed_key is not None:
-            self._memoized = {hashed_key : ret}
+        # Coroutines cannot be awaited twice and stale elements returned
+        # by asynchronous DynamicMaps should not be memoized
+        if hashed_key is not None and not self.coroutine and not stale[0]:
+            self._memoized.pop(hashed_key, None)
+            self._memoized[hashed_key] = ret
+            while len(self._memoized) > self.memoize_size:
+                self._memoized.pop(next(iter(self._memoized)))
         return ret
 
 
@@ -563,6 +650,51 @@ class Generator(Callable):
             self.warning(msg.format(name=self.name))
             raise
 
+    def _call(self, args, kwargs, memoize=None, streams=[]):
+        return self()
+
+
+_async_executor = None
+
+def _default_executor():
+    """
+    Returns the thread pool used to evaluate asynchronous DynamicMap
+    callbacks that do not declare their own executor.
+    """
+    global _async_executor
+    if _async_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _async_executor = ThreadPoolExecutor(4)
+    return _async_executor
+
+
+def _run_coroutine(coroutine):
+    """
+    Runs the coroutine to completion on a new event loop.
+    """
+    import asyncio
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def _submit_coroutine(coroutine):
+    """
+    Schedules the coroutine on the event loop running in the current
+    thread, or if there is none on a new event loop in a separate
+    thread, returning a future.
+    """
+    import asyncio
+    try:
+        loop = asyncio.get_running_loop()
+    except (AttributeError, RuntimeError):
+        loop = None
+    if loop is None:
+        return _default_executor().submit(_run_coroutine, coroutine)
+    return asyncio.ensure_future(coroutine, loop=loop)
+
 
 def get_nested_dmaps(dmap):
     """
@@ -680,9 +812,30 @@ class DynamicMap(HoloMap):
        updating the streams.""" )
 
     cache_size = param.Integer(default=500, doc="""
-       The number of entries to cache for fast access. This is an LRU
-       cache where the least recently used item is overwritten once
-       the cache is full.""")
+       The number of entries to cache for fast access. Once the cache
+       is full items are evicted according to the cache_policy.""")
+
+    cache_bytes = param.Integer(default=None, allow_None=True, doc="""
+       Optional upper bound on the approximate number of bytes held in
+       the cache, computed by summing the nbytes of the data of all
+       cached elements. Items are evicted according to the cache_policy
+       until the cache fits within this bound, although the most
+       recently generated item is always retained.""")
+
+    cache_policy = param.ObjectSelector(default='lru', objects=['lru', 'lfu'], doc="""
+       The policy used to evict items once the cache is full. The 'lru'
+       policy evicts the least recently used item while the 'lfu'
+       policy evicts the least frequently used item, breaking ties
+       by evicting the least recently used of those items.""")
+
+    executor = param.Parameter(default=None, doc="""
+       Optional executor used to evaluate the callback asynchronously
+       in response to stream events, either 'threads' to use a shared
+       thread pool or a concurrent.futures.Executor. While the callback
+       is being evaluated the most recently generated element is
+       returned, only the result for the latest event is kept and the
+       plots are refreshed once it is ready. Callbacks which are
+       coroutine functions are always evaluated asynchronously.""")
 
     def __init__(self, callback, initial_items=None, **params):
 
@@ -723,6 +876,38 @@ class DynamicMap(HoloMap):
                 stream.source = self
         self.redim = redim(self, mode='dynamic')
         self.periodic = periodic(self)
+        self._cache_usage = OrderedDict()
+        self._cache_stats = dict(hits=0, misses=0, evictions=0)
+
+        if self.executor not in [None, 'threads'] and not hasattr(self.executor, 'submit'):
+            raise ValueError("DynamicMap executor must be None, 'threads' or a "
+                             "concurrent.futures Executor, found %r." % self.executor)
+        elif self.executor == 'threads':
+            try:
+                import concurrent.futures # noqa (Availability import)
+            except ImportError:
+                raise ImportError("DynamicMap executor='threads' requires the "
+                                  "concurrent.futures module, which may be "
+                                  "installed on Python 2 as the futures package.")
+        # Latest (key, element) generated and (key, future) being evaluated
+        self._async_value = None
+        self._async_pending = None
+        # Element returned to plots refreshed after evaluation completes
+        self._async_ready = None
+        self._async_inline = False
+        # Function used to schedule plot refreshes, set by the backend
+        self._async_schedule = None
+
+    @property
+    def cache_stats(self):
+        """
+        Returns a dictionary of cache statistics, reporting the number
+        of cache hits, misses and evictions along with the current
+        number of cached items and their approximate size in bytes.
+        """
+        self._sync_cache_usage()
+        return dict(self._cache_stats, size=len(self),
+                    nbytes=sum(n for _, n in self._cache_usage.values()))
 
     @property
     def unbounded(self):
@@ -846,9 +1031,126 @@ class DynamicMap(HoloMap):
         else:
             kwargs = dict(flattened)
 
+        asynchronous = self.executor is not None or self.callback.coroutine
+        if (asynchronous and self._async_value is not None and
+            any(s._triggering for s in self.streams)):
+            return self._execute_async(args, kwargs)
+
+        (self.callback.args, self.callback.kwargs) = (args, kwargs)
         with dynamicmap_memoization(self.callback, self.streams):
-            retval = self.callback(*args, **kwargs)
-        return self._style(retval)
+            retval = self.callback._call(args, kwargs, streams=self.streams)
+        if self.callback.coroutine:
+            retval = _default_executor().submit(_run_coroutine, retval).result()
+        retval = self._style(retval)
+        if asynchronous:
+            self._async_value = (self._async_key(args, kwargs), retval)
+        return retval
+
+
+    def _async_key(self, args, kwargs):
+        """
+        Hashes the callback arguments identifying an asynchronous
+        evaluation.
+        """
+        kwargs = self.callback._hash_kwargs(kwargs, self.streams)
+        return util.deephash(args + tuple(sorted(kwargs.items())))
+
+
+    def _execute_async(self, args, kwargs):
+        """
+        Submits the callback for asynchronous evaluation, cancelling
+        or discarding any evaluation in progress, and returns the most
+        recently generated element until the result is ready.
+        """
+        if self._async_ready is not None:
+            return self._async_ready
+        key = self._async_key(args, kwargs)
+        # Events on transient streams always have to be evaluated
+        transient = any(s.transient and s._triggering for s in self.streams)
+        done_key, value = self._async_value
+        if key is not None and key == done_key and not transient:
+            return value
+
+        pending = self._async_pending
+        if pending is None or transient or key is None or key != pending[0]:
+            if pending is not None:
+                pending[1].cancel()
+            if self.callback.coroutine:
+                future = _submit_coroutine(self.callback(*args, **kwargs))
+            else:
+                executor = self.executor
+                if executor == 'threads':
+                    executor = _default_executor()
+                # The streams are no longer triggering once the callback
+                # is evaluated, so the memoization state is passed along
+                memoize = self.callback.memoize and not transient
+                (self.callback.args, self.callback.kwargs) = (args, kwargs)
+                future = executor.submit(self.callback._call, args, kwargs,
+                                         memoize, self.streams)
+            self._async_pending = (key, future)
+            self._async_inline = True
+            try:
+                loop = util.current_ioloop() if self._async_schedule is None else None
+                future.add_done_callback(partial(self._async_done, key, loop))
+            finally:
+                self._async_inline = False
+
+        # Evaluation may already have completed
+        done_key, value = self._async_value
+        if key is not None and key == done_key and self._async_pending is None:
+            return value
+        _mark_stale()
+        return value
+
+
+    def _async_done(self, key, loop, future):
+        """
+        Stores the result of an asynchronous evaluation, unless it has
+        been superseded, and schedules a refresh of the plots on the
+        document or, failing that, on the event loop of the thread the
+        evaluation was submitted from.
+        """
+        pending = self._async_pending
+        if future.cancelled() or pending is None or pending[1] is not future:
+            return
+        self._async_pending = None
+        try:
+            value = self._style(future.result())
+        except Exception as e:
+            self.warning('Asynchronous callback raised %s: %s'
+                         % (type(e).__name__, e))
+            return
+        self._async_value = (key, value)
+        if self._async_inline:
+            return
+        refresh = partial(self._async_refresh, value)
+        if self._async_schedule is not None:
+            self._async_schedule(refresh)
+        elif loop is not None:
+            loop.add_callback(refresh)
+        else:
+            refresh()
+
+
+    def _async_refresh(self, value):
+        """
+        Refreshes the plots subscribed to the streams, which receive
+        the element generated by the asynchronous evaluation.
+        """
+        if self._async_value is None or self._async_value[1] is not value:
+            return
+        subscribers = [s for stream in self.streams
+                       for p, s in sorted(stream._subscribers, key=lambda x: x[0])
+                       if p > 1]
+        contents = dict(kv for stream in self.streams
+                        for kv in stream.contents.items())
+        self._async_ready = value
+        try:
+            with triggering_streams(self.streams):
+                for subscriber in util.unique_iterator(subscribers):
+                    subscriber(**contents)
+        finally:
+            self._async_ready = None
 
 
     def opts(self, options=None, **kwargs):
@@ -890,6 +1192,7 @@ class DynamicMap(HoloMap):
         Return a cleared dynamic map with a cleared cached
         """
         self.data = OrderedDict()
+        self._cache_usage = OrderedDict()
         return self
 
 
@@ -921,8 +1224,10 @@ class DynamicMap(HoloMap):
             key = util.wrap_tuple(inner_key)
             if key in cache:
                 val = cache[key]
+                self._cache_hit(key)
             else:
                 val = self._execute_callback(*key)
+                self._cache_stats['misses'] += 1
             if data_slice:
                 val = self._dataslice(val, data_slice)
             data.append((key, val))
@@ -1010,11 +1315,17 @@ class DynamicMap(HoloMap):
             return product
 
         # Not a cross product and nothing cached so compute element.
-        if cache is not None: return cache
-        val = self._execute_callback(*tuple_key)
+        if cache is not None:
+            if not sample:
+                self._cache_hit(tuple_key)
+            return cache
+        self._cache_stats['misses'] += 1
+        with _track_stale() as stale:
+            val = self._execute_callback(*tuple_key)
         if data_slice:
             val = self._dataslice(val, data_slice)
-        self._cache(tuple_key, val)
+        if not stale[0]:
+            self._cache(tuple_key, val)
         return val
 
 
@@ -1050,16 +1361,76 @@ class DynamicMap(HoloMap):
                            streams=self.streams, shared_data=True)
 
 
+    def _cache_nbytes(self, obj):
+        """
+        Returns the approximate number of bytes held by the data of
+        all the elements in the supplied object.
+        """
+        return sum(obj.traverse(lambda x: util.nbytes(x.data),
+                                [lambda x: not x._deep_indexable]))
+
+
+    def _sync_cache_usage(self):
+        """
+        Ensures the cache usage records match the cached items, which
+        may have been modified directly, e.g. when cloning. Untracked
+        items are considered the least recently used.
+        """
+        usage = self._cache_usage
+        if len(usage) == len(self.data) and all(k in self.data for k in usage):
+            return
+        untracked = [(k, [0, self._cache_nbytes(v)])
+                     for k, v in self.data.items() if k not in usage]
+        tracked = [(k, u) for k, u in usage.items() if k in self.data]
+        self._cache_usage = OrderedDict(untracked + tracked)
+
+
+    def _cache_hit(self, key):
+        """
+        Records a cache hit on the supplied key, updating the usage
+        count and marking it as the most recently used item.
+        """
+        self._cache_stats['hits'] += 1
+        usage = self._cache_usage.pop(key, None)
+        if usage is not None:
+            usage[0] += 1
+            self._cache_usage[key] = usage
+
+
+    def _cache_victim(self):
+        """
+        Returns the key of the item to evict next according to the
+        cache_policy.
+        """
+        usage = self._cache_usage
+        if self.cache_policy == 'lfu':
+            return min(usage, key=lambda k: usage[k][0])
+        return next(iter(usage))
+
+
     def _cache(self, key, val):
         """
-        Request that a key/value pair be considered for caching.
+        Request that a key/value pair be considered for caching,
+        evicting items according to the cache_policy until the new
+        item fits within the cache_size and cache_bytes bounds.
         """
         cache_size = (1 if util.dimensionless_contents(self.streams, self.kdims)
                       else self.cache_size)
-        if len(self) >= cache_size:
-            first_key = next(k for k in self.data)
-            self.data.pop(first_key)
+        self._sync_cache_usage()
+        usage = self._cache_usage
+        nbytes = self._cache_nbytes(val)
+        while usage:
+            cached_bytes = sum(n for _, n in usage.values())
+            if (len(self) < cache_size and (self.cache_bytes is None or
+                cached_bytes + nbytes <= self.cache_bytes)):
+                break
+            evicted = self._cache_victim()
+            self.pop(evicted)
+            usage.pop(evicted)
+            self._cache_stats['evictions'] += 1
         self[key] = val
+        usage.pop(key, None)
+        usage[key] = [1, nbytes]
 
 
     def map(self, map_fn, specs=None, clone=True, link_inputs=True):
@@ -1,5 +1,6 @@
 import os, sys, warnings, operator
 import time
+import hashlib
 import types
 import numbers
 import inspect
@@ -35,11 +36,6 @@ try:
 except ImportError:
     pd = None
 
-try:
-    import dask.dataframe as dd
-except ImportError:
-    dd = None
-
 
 
 class Config(param.ParameterizedFunction):
@@ -86,6 +82,9 @@ class HashableJSON(json.JSONEncoder):
 
     One limitation of this approach is that dictionaries with composite
     keys (e.g tuples) are not supported due to the JSON spec.
+
+    Deprecated: deephash now uses the ContentHasher, HashableJSON is
+    no longer used by HoloViews and will be removed in future.
     """
     string_hashable = (dt.datetime,)
     repr_hashable = ()
@@ -178,17 +177,118 @@ class periodic(Thread):
 
 
 
+class ContentHasher(object):
+    """
+    Generates a digest of the contents of arbitrarily nested objects,
+    suitable for memoization and other cases where deep equality must
+    be tested without storing the entire object.
+
+    Unlike HashableJSON, the buffers of NumPy arrays and pandas
+    objects are hashed directly instead of first being converted to
+    lists or strings, making it possible to hash large arrays and
+    DataFrames cheaply. Lists and tuples are hashed in order while
+    dictionaries and sets are hashed independent of their ordering.
+    Objects of unrecognized types are represented by their hash or,
+    if they are not hashable, by their id.
+
+    Support for additional types may be added by supplying handlers
+    or registering them on the handlers dictionary of an instance,
+    mapping from the type to a function returning a hashable
+    representation of the object, which is then hashed recursively.
+    """
+
+    string_hashable = (dt.datetime,)
+
+    repr_hashable = (numbers.Number, type(None))
+
+    def __init__(self, algorithm=None, handlers=None):
+        if algorithm is None:
+            algorithm = getattr(hashlib, 'blake2b', hashlib.sha1)
+        self.algorithm = algorithm
+        self.handlers = OrderedDict(handlers or [])
+
+    def __call__(self, obj):
+        hasher = self.algorithm()
+        self._update(hasher, obj)
+        return hasher.hexdigest()
+
+    def _digest(self, obj):
+        hasher = self.algorithm()
+        self._update(hasher, obj)
+        return hasher.digest()
+
+    def _update_bytes(self, hasher, data):
+        hasher.update(('%d:' % len(data)).encode('utf-8'))
+        hasher.update(data)
+
+    def _update_array(self, hasher, arr):
+        arr = np.asarray(arr)
+        self._update_bytes(hasher, ('%s%s' % (arr.dtype.str, arr.shape)).encode('utf-8'))
+        if arr.dtype.kind == 'O':
+            for v in arr.flat:
+                self._update(hasher, v)
+        else:
+            hasher.update(np.ascontiguousarray(arr.reshape(-1)).view(np.uint8))
+
+    def _update(self, hasher, obj):
+        for obj_type, handler in self.handlers.items():
+            if isinstance(obj, obj_type):
+                hasher.update(type(obj).__name__.encode('utf-8'))
+                self._update(hasher, handler(obj))
+                return
+
+        hasher.update(type(obj).__name__.encode('utf-8'))
+        if isinstance(obj, bytes):
+            self._update_bytes(hasher, obj)
+        elif isinstance(obj, basestring):
+            self._update_bytes(hasher, obj.encode('utf-8'))
+        elif isinstance(obj, self.repr_hashable):
+            self._update_bytes(hasher, repr(obj).encode('utf-8'))
+        elif isinstance(obj, (list, tuple)):
+            self._update_bytes(hasher, str(len(obj)).encode('utf-8'))
+            for v in obj:
+                self._update(hasher, v)
+        elif isinstance(obj, dict):
+            self._update_bytes(hasher, str(len(obj)).encode('utf-8'))
+            for digest in sorted(self._digest(item) for item in obj.items()):
+                hasher.update(digest)
+        elif isinstance(obj, (set, frozenset)):
+            self._update_bytes(hasher, str(len(obj)).encode('utf-8'))
+            for digest in sorted(self._digest(v) for v in obj):
+                hasher.update(digest)
+        elif isinstance(obj, (np.ndarray, np.generic)):
+            self._update_array(hasher, obj)
+        elif pd and isinstance(obj, (pd.Series, pd.DataFrame, pd.Index)):
+            names = list(obj.columns) if isinstance(obj, pd.DataFrame) else [obj.name]
+            self._update(hasher, names)
+            if isinstance(obj, pd.Index):
+                obj = obj.to_series()
+            self._update_array(hasher, pd.util.hash_pandas_object(obj, index=True).values)
+        elif isinstance(obj, self.string_hashable):
+            self._update_bytes(hasher, str(obj).encode('utf-8'))
+        else:
+            try:
+                token = hash(obj)
+            except:
+                token = id(obj)
+            self._update_bytes(hasher, str(token).encode('utf-8'))
+
+
 def deephash(obj):
     """
-    Given an object, return a hash using HashableJSON. This hash is not
-    architecture, Python version or platform independent.
+    Given an object, return an integer hash of its contents using
+    the ContentHasher. This hash is not architecture, Python version
+    or platform independent.
     """
     try:
-        return hash(json.dumps(obj, cls=HashableJSON, sort_keys=True))
+        return int(_content_hasher(obj), 16)
     except:
         return None
 
 
+_content_hasher = ContentHasher()
+
+
 # Python3 compatibility
 if sys.version_info.major == 3:
     basestring = str
@@ -335,6 +435,46 @@ def callable_name(callable_obj):
         return str(callable_obj)
 
 
+def ioloop_running(loop):
+    """
+    Whether the supplied tornado IOLoop is currently running.
+    """
+    asyncio_loop = getattr(loop, 'asyncio_loop', None)
+    if asyncio_loop is not None:
+        return asyncio_loop.is_running()
+    return bool(getattr(loop, '_running', False))
+
+
+def current_ioloop():
+    """
+    Returns the tornado IOLoop running on the current thread or None
+    if tornado is not available or no event loop is running, since
+    callbacks added to a loop which is not running are never invoked.
+    """
+    try:
+        from tornado.ioloop import IOLoop
+        loop = IOLoop.current(instance=False)
+    except Exception:
+        return None
+    return loop if loop is not None and ioloop_running(loop) else None
+
+
+def iscoroutinefunction(callable_obj):
+    """
+    Whether the callable is a coroutine function (or a partial or
+    callable object wrapping one), i.e. returns a coroutine when
+    called. Always False on Python versions without coroutines.
+    """
+    check = getattr(inspect, 'iscoroutinefunction', None)
+    if check is None:
+        return False
+    while isinstance(callable_obj, partial):
+        callable_obj = callable_obj.func
+    if inspect.isfunction(callable_obj) or inspect.ismethod(callable_obj):
+        return check(callable_obj)
+    return check(getattr(callable_obj, '__call__', None))
+
+
 def process_ellipses(obj, key, vdim_selection=False):
     """
     Helper function to pad a __getitem__ key with the right number of
@@ -1124,10 +1264,43 @@ def is_dataframe(data):
     """
     Checks whether the supplied data is DataFrame type.
     """
+    # A dask DataFrame can only exist if dask.dataframe was imported
+    dd = sys.modules.get('dask.dataframe')
     return((pd is not None and isinstance(data, pd.DataFrame)) or
           (dd is not None and isinstance(data, dd.DataFrame)))
 
 
+def module_available(name):
+    """
+    Checks whether the named top-level module is importable without
+    actually importing it.
+    """
+    try:
+        from importlib.util import find_spec
+    except ImportError:
+        from pkgutil import find_loader as find_spec
+    return find_spec(name) is not None
+
+
+def nbytes(data):
+    """
+    Returns the approximate number of bytes held by the supplied data,
+    summing the nbytes of all arrays (or array-like objects) found in
+    nested dictionaries, lists and tuples. Objects which do not declare
+    their size are ignored.
+    """
+    if isinstance(data, dict):
+        return sum(nbytes(v) for v in data.values())
+    elif isinstance(data, (list, tuple)):
+        return sum(nbytes(v) for v in data)
+    elif pd and isinstance(data, (pd.DataFrame, pd.Series)):
+        return int(np.sum(data.memory_usage(index=True)))
+    try:
+        return int(data.nbytes)
+    except:
+        return 0
+
+
 def get_param_values(data):
     params = dict(kdims=data.kdims, vdims=data.vdims,
                   label=data.label)
@@ -122,6 +122,8 @@ class Graph(Dataset, Element2D):
             edgepaths = EdgePaths(edgepaths)
         self._nodes = nodes
         self._edgepaths = edgepaths
+        self._computed_edgepaths = None
+        self._node_index, self._edge_index = None, None
         super(Graph, self).__init__(edges, **params)
         if self._nodes is None and node_info:
             nodes = self.nodes.clone(datatype=['pandas', 'dictionary'])
@@ -162,6 +164,8 @@ class Graph(Dataset, Element2D):
 
 
     def clone(self, data=None, shared_data=True, new_type=None, *args, **overrides):
+        shared_index = (data is None and shared_data and new_type is None and
+                        not any(d in overrides for d in ('kdims', 'vdims')))
         if data is None:
             data = (self.data, self.nodes)
             if self._edgepaths:
@@ -170,7 +174,12 @@ class Graph(Dataset, Element2D):
             data = (data, self.nodes)
             if self._edgepaths:
                 data = data + (self.edgepaths,)
-        return super(Graph, self).clone(data, shared_data, new_type, *args, **overrides)
+        cloned = super(Graph, self).clone(data, shared_data, new_type, *args, **overrides)
+        if shared_index and isinstance(cloned, Graph):
+            # Indexes are only valid while the edges and nodes are unchanged
+            cloned._node_index, cloned._edge_index = self._node_index, self._edge_index
+            cloned._computed_edgepaths = self._computed_edgepaths
+        return cloned
 
 
     def select(self, selection_specs=None, selection_mode='edges', **selection):
@@ -203,16 +212,14 @@ class Graph(Dataset, Element2D):
         # Compute mask for edges if nodes were selected on
         nodemask = None
         if len(nodes) != len(self.nodes):
-            xdim, ydim = dimensions[:2]
-            indices = list(nodes.dimension_values(2, False))
+            selected = self._node_positions(nodes.dimension_values(2))
             if selection_mode == 'edges':
-                mask1 = self.interface.select_mask(self, {xdim.name: indices})
-                mask2 = self.interface.select_mask(self, {ydim.name: indices})
-                nodemask = (mask1 | mask2)
+                edges = self.node_edges(selected, positions=True)
                 nodes = self.nodes
             else:
-                nodemask = self.interface.select_mask(self, {xdim.name: indices,
-                                                             ydim.name: indices})
+                edges = self.node_edges(selected, positions=True, induced=True)
+            nodemask = np.zeros(len(self), dtype=bool)
+            nodemask[edges] = True
 
         # Compute mask for edge selection
         mask = None
@@ -230,11 +237,9 @@ class Graph(Dataset, Element2D):
         if mask is not None:
             data = self.interface.select(self, mask)
             if not np.all(mask):
-                new_graph = self.clone((data, nodes))
-                source = new_graph.dimension_values(0, expanded=False)
-                target = new_graph.dimension_values(1, expanded=False)
-                unique_nodes = np.unique(np.concatenate([source, target]))
-                nodes = new_graph.nodes[:, :, list(unique_nodes)]
+                source, target = self._get_edge_index()[:2]
+                connected = np.unique(np.concatenate([source[mask], target[mask]]))
+                nodes = self.nodes.iloc[connected[connected >= 0]]
             paths = None
             if self._edgepaths:
                 edgepaths = self._split_edgepaths
@@ -244,15 +249,24 @@ class Graph(Dataset, Element2D):
         else:
             data = self.data
             paths = self._edgepaths
-        return self.clone((data, nodes, paths))
+        selected = self.clone((data, nodes, paths))
+        if self._computed_edgepaths is not None and paths is None:
+            # Reuse the direct edge paths computed on this Graph
+            edgepaths = self._computed_edgepaths
+            if mask is not None:
+                coords = self._edge_coordinates(edgepaths)[mask]
+                edgepaths = edgepaths.clone([self._join_edges(coords)])
+            selected._computed_edgepaths = edgepaths
+        return selected
 
 
     @property
     def _split_edgepaths(self):
-        if len(self) == len(self._edgepaths.data):
-            return self._edgepaths
+        edgepaths = self.edgepaths
+        if len(self) == len(edgepaths.data):
+            return edgepaths
         else:
-            return self._edgepaths.clone(split_path(self._edgepaths))
+            return edgepaths.clone(split_path(edgepaths))
 
 
     def range(self, dimension, data_range=True):
@@ -299,16 +313,136 @@ class Graph(Dataset, Element2D):
         """
         if self._edgepaths:
             return self._edgepaths
-        paths = []
-        for start, end in self.array(self.kdims):
-            start_ds = self.nodes[:, :, start]
-            end_ds = self.nodes[:, :, end]
-            if not len(start_ds) or not len(end_ds):
-                raise ValueError('Could not find node positions for all edges')
-            sx, sy = start_ds.array(start_ds.kdims[:2]).T
-            ex, ey = end_ds.array(end_ds.kdims[:2]).T
-            paths.append([(sx[0], sy[0]), (ex[0], ey[0])])
-        return EdgePaths(paths, kdims=self.nodes.kdims[:2])
+        elif self._computed_edgepaths is not None:
+            return self._computed_edgepaths
+
+        nodes = self.nodes
+        positions = [self._node_positions(self.dimension_values(i))
+                     for i in range(2)]
+        if any((p < 0).any() for p in positions):
+            raise ValueError('Could not find node positions for all edges')
+        xs, ys = (nodes.dimension_values(i) for i in range(2))
+        coords = np.empty((len(self), 2, 2))
+        for i, p in enumerate(positions):
+            coords[:, i, 0] = xs[p]
+            coords[:, i, 1] = ys[p]
+        paths = [self._join_edges(coords)] if len(coords) else []
+        self._computed_edgepaths = EdgePaths(paths, kdims=nodes.kdims[:2])
+        return self._computed_edgepaths
+
+
+    def node_edges(self, nodes, positions=False, induced=False):
+        """
+        Returns the integer indices of the edges connected to the
+        supplied node indices, using an adjacency index over the edges
+        built the first time it is required. If induced is True only
+        edges between the supplied nodes are returned. If positions is
+        True the nodes are given as integer positions into the nodes
+        rather than node indices.
+        """
+        nodes = np.asarray(nodes)
+        if not positions:
+            nodes = self._node_positions(nodes)
+        nodes = np.unique(nodes[nodes >= 0])
+        source, target, source_adjacency, target_adjacency = self._get_edge_index()
+        outgoing = self._adjacent(source_adjacency, nodes)
+        if induced:
+            selected = np.zeros(len(self.nodes)+1, dtype=bool)
+            selected[nodes] = True
+            return outgoing[selected[target[outgoing]]]
+        incoming = self._adjacent(target_adjacency, nodes)
+        return np.unique(np.concatenate([outgoing, incoming]))
+
+
+    @classmethod
+    def _adjacent(cls, adjacency, nodes):
+        """
+        Looks up the edges of the supplied node positions in an
+        adjacency index in compressed sparse row format.
+        """
+        indptr, edges = adjacency
+        starts, counts = indptr[nodes], indptr[nodes+1]-indptr[nodes]
+        offsets = np.cumsum(counts)-counts
+        rows = np.arange(counts.sum())+np.repeat(starts-offsets, counts)
+        return np.sort(edges[rows])
+
+
+    def _get_edge_index(self):
+        """
+        Returns the node positions of the source and target of each
+        edge along with the adjacency of each node as outgoing and
+        incoming edges in compressed sparse row format. Edges without
+        a matching node are assigned position -1 and are omitted from
+        the adjacency.
+        """
+        if self._edge_index is None:
+            nnodes = len(self.nodes)
+            index = []
+            for i in range(2):
+                positions = self._node_positions(self.dimension_values(i))
+                valid = np.where(positions >= 0)[0]
+                order = valid[np.argsort(positions[valid], kind='mergesort')]
+                counts = np.bincount(positions[valid], minlength=nnodes)
+                indptr = np.concatenate([[0], np.cumsum(counts)])
+                index.append((positions, (indptr, order)))
+            (source, outgoing), (target, incoming) = index
+            self._edge_index = (source, target, outgoing, incoming)
+        return self._edge_index
+
+
+    def _node_positions(self, values):
+        """
+        Returns the position of the supplied node indices in the
+        nodes, with -1 marking indices without a matching node.
+        """
+        if self._node_index is None:
+            index = self.nodes.dimension_values(2)
+            try:
+                order = np.argsort(index, kind='mergesort')
+                self._node_index = (order, index[order])
+            except TypeError:
+                lookup = {}
+                for i, v in enumerate(index):
+                    lookup.setdefault(v, i)
+                self._node_index = lookup
+        values = np.asarray(values)
+        if isinstance(self._node_index, dict):
+            lookup = self._node_index
+            return np.array([lookup.get(v, -1) for v in values], dtype=int)
+        order, sorted_index = self._node_index
+        if not len(order):
+            return np.full(len(values), -1, dtype=int)
+        try:
+            found = np.searchsorted(sorted_index, values)
+        except TypeError:
+            return np.full(len(values), -1, dtype=int)
+        clipped = np.minimum(found, len(order)-1)
+        matched = (found < len(order)) & (sorted_index[clipped] == values)
+        return np.where(matched, order[clipped], -1)
+
+
+    @classmethod
+    def _join_edges(cls, coords):
+        """
+        Joins an array of edge coordinates of shape (edges, 2, 2)
+        into a single NaN separated path.
+        """
+        joined = np.full((len(coords), 3, 2), np.NaN)
+        joined[:, :2] = coords
+        return joined.reshape(-1, 2)[:-1]
+
+
+    @classmethod
+    def _edge_coordinates(cls, edgepaths):
+        """
+        Inverse of _join_edges, returning the edge coordinates of
+        shape (edges, 2, 2) from a single NaN separated path.
+        """
+        if not edgepaths.data:
+            return np.empty((0, 2, 2))
+        path = edgepaths.array(edgepaths.kdims[:2])
+        padded = np.concatenate([path, [[np.NaN, np.NaN]]])
+        return padded.reshape(-1, 3, 2)[:, :2]
 
 
     @classmethod
@@ -8,7 +8,7 @@ from ..core.boundingregion import BoundingBox
 from ..core.operation import Operation
 from ..core.sheetcoords import Slice
 from ..core.util import (is_nan, sort_topologically, one_to_one,
-                         cartesian_product, is_cyclic)
+                         cartesian_product, is_cyclic, module_available)
 
 try:
     import pandas as pd
@@ -16,16 +16,6 @@ try:
 except:
     pd = None
 
-try:
-    import dask
-except:
-    dask = None
-
-try:
-    import xarray as xr
-except:
-    xr = None
-
 
 
 def compute_edges(edges):
@@ -53,7 +43,7 @@ def split_path(path):
     """
     path = path.split()[0]
     values = path.dimension_values(0)
-    splits = np.concatenate([[0], np.where(np.isnan(values))[0]+1, [0]])
+    splits = np.concatenate([[0], np.where(np.isnan(values))[0]+1, [len(values)+1]])
     subpaths = []
     data = PandasInterface.as_dframe(path) if pd else path.array()
     for i in range(len(splits)-1):
@@ -143,7 +133,7 @@ class categorical_aggregate2d(Operation):
             kdims=['Country', 'Year'], vdims=['Population'])
     """
 
-    datatype = param.List(['xarray', 'grid'] if xr else ['grid'], doc="""
+    datatype = param.List(['xarray', 'grid'] if module_available('xarray') else ['grid'], doc="""
         The grid interface types to use when constructing the gridded Dataset.""")
 
     def _get_coords(self, obj):
@@ -1,4 +1,5 @@
 from ..core import Dimensioned, AttrTree
+from ..core.util import module_available
 
 try:
     import pandas
@@ -6,11 +7,13 @@ try:
 except:
     pandas = None
 
-try:
-    import seaborn
-    from .seaborn import *     # noqa (API import)
-except:
-    seaborn = None
+# The seaborn library itself is only imported by the plotting code
+seaborn = None
+if module_available('seaborn'):
+    try:
+        from .seaborn import *     # noqa (API import)
+    except:
+        pass
 
 from .collector import *       # noqa (API import)
 
@@ -28,7 +28,9 @@ except:
 
 from ..core import (Operation, Element, Dimension, NdOverlay,
                     CompositeOverlay, Dataset)
-from ..core.data import PandasInterface, DaskInterface, XArrayInterface
+from ..core.data import PandasInterface
+from ..core.data.dask import DaskInterface
+from ..core.data.xarray import XArrayInterface
 from ..core.sheetcoords import BoundingBox
 from ..core.util import get_param_values, basestring
 from ..element import Image, Path, Curve, Contours, RGB, Graph
@@ -15,7 +15,9 @@ BokehScrubberWidget.prototype = Object.create(ScrubberWidget.prototype);
 var BokehMethods = {
 	update_cache : function(){
 		$.each(this.frames, $.proxy(function(index, frame) {
-			this.frames[index] = JSON.parse(frame);
+			if (typeof frame === 'string') {
+				this.frames[index] = JSON.parse(frame);
+			}
 		}, this));
 	},
 	update : function(current){
@@ -1,11 +1,14 @@
+import time
 from collections import defaultdict
+from functools import partial
+
 from bokeh.models import CustomJS
 
-from ...core import OrderedDict
+from ...core import OrderedDict, util
 from ...streams import (Stream, PointerXY, RangeXY, Selection1D, RangeX,
                         RangeY, PointerX, PointerY, BoundsX, BoundsY,
                         Tap, SingleTap, DoubleTap, MouseEnter, MouseLeave,
-                        PlotSize, Draw, BoundsXY)
+                        PlotSize, Draw, BoundsXY, Throttle)
 from ...streams import PositionX, PositionY, PositionXY, Bounds # Deprecated: remove in 2.0
 from ..comms import JupyterCommJS
 from .util import bokeh_version
@@ -37,6 +40,13 @@ class MessageCallback(object):
     # List of change events on the models to listen to
     on_changes = []
 
+    # Minimum interval in milliseconds between processing events, any
+    # events arriving in quicker succession are handled according to
+    # the throttle_policy (one of 'leading', 'trailing' or 'max-rate')
+    throttle_timeout = 50
+
+    throttle_policy = 'max-rate'
+
     _callbacks = {}
 
     def _process_msg(self, msg):
@@ -51,12 +61,53 @@ class MessageCallback(object):
         self.plot = plot
         self.streams = streams
         if plot.renderer.mode != 'server':
-            self.comm = self._comm_type(plot, on_msg=self.on_msg)
+            self.comm = self._comm_type(plot, on_msg=self.on_comm_msg)
         self.source = source
         self.handle_ids = defaultdict(dict)
         self.callbacks = []
         self.plot_handles = {}
         self._queue = []
+        self._receiving = False
+        if self.throttle_timeout:
+            self.throttle = Throttle(self.throttle_timeout/1000.,
+                                     self.throttle_policy, self._schedule)
+        else:
+            self.throttle = None
+
+
+    @property
+    def stats(self):
+        """
+        Event statistics recorded by the callback throttle, counting
+        the events and how many of them were triggered or dropped.
+        """
+        return None if self.throttle is None else dict(self.throttle.stats)
+
+
+    def _schedule(self, fn, delay):
+        """
+        Schedules a deferred event on the event loop the events are
+        received on, delay is given in seconds.
+        """
+        loop = util.current_ioloop()
+        if self.plot.renderer.mode == 'server':
+            self.plot.document.add_timeout_callback(fn, int(delay*1000))
+        elif loop is not None:
+            loop.call_later(delay, fn)
+        else:
+            # Calls deferred without a running event loop would never run
+            time.sleep(delay)
+            fn()
+
+
+    def _throttled(self, fn):
+        """
+        Passes the function through the throttle, if any.
+        """
+        if self.throttle is None:
+            fn()
+        else:
+            self.throttle(fn)
 
 
     def _filter_msg(self, msg, ids):
@@ -75,6 +126,31 @@ class MessageCallback(object):
         return filtered_msg
 
 
+    def on_comm_msg(self, msg):
+        """
+        Handles messages received on the comm, throttling them before
+        updating the streams.
+        """
+        self._receiving = True
+        try:
+            self._throttled(partial(self._handle_comm_msg, msg))
+        finally:
+            self._receiving = False
+
+
+    def _handle_comm_msg(self, msg):
+        """
+        Updates the streams with a message received on the comm. The
+        comm only reports the output and errors of messages handled
+        while they are received, so deferred messages are handled
+        through the comm to report them to the frontend.
+        """
+        if self._receiving:
+            self.on_msg(msg)
+        else:
+            self.comm.invoke(partial(self.on_msg, msg), self.comm.id)
+
+
     def on_msg(self, msg):
         streams = []
         for stream in self.streams:
@@ -350,24 +426,31 @@ class ServerCallback(MessageCallback):
         return {'id': model.ref['id'], 'value': resolved}
 
 
+    def _next_tick(self, fn):
+        """
+        Defers processing to the next tick so that concerted value
+        changes are processed at once rather than firing off multiple
+        plot updates.
+        """
+        self.plot.document.add_next_tick_callback(fn)
+
+
     def on_change(self, attr, old, new):
         """
-        Process change events adding timeout to process multiple concerted
-        value change at once rather than firing off multiple plot updates.
+        Process change events, throttling them to avoid processing
+        rapid successions of changes.
         """
         self._queue.append((attr, old, new))
-        if self.process_on_change not in self.plot.document._session_callbacks:
-            self.plot.document.add_timeout_callback(self.process_on_change, 50)
+        self._throttled(partial(self._next_tick, self.process_on_change))
 
 
     def on_event(self, event):
         """
-        Process bokeh UIEvents adding timeout to process multiple concerted
-        value change at once rather than firing off multiple plot updates.
+        Process bokeh UIEvents, throttling them to avoid processing
+        rapid successions of events.
         """
         self._queue.append((event))
-        if self.process_on_event not in self.plot.document._session_callbacks:
-            self.plot.document.add_timeout_callback(self.process_on_event, 50)
+        self._throttled(partial(self._next_tick, self.process_on_event))
 
 
     def process_on_event(self):
@@ -388,7 +471,6 @@ class ServerCallback(MessageCallback):
                 model_obj = self.plot_handles.get(self.models[0])
                 msg[attr] = self.resolve_attr_spec(path, event, model_obj)
             self.on_msg(msg)
-        self.plot.document.add_timeout_callback(self.process_on_event, 50)
 
 
     def process_on_change(self):
@@ -408,7 +490,6 @@ class ServerCallback(MessageCallback):
             msg[attr] = self.resolve_attr_spec(path, cb_obj)
 
         self.on_msg(msg)
-        self.plot.document.add_timeout_callback(self.process_on_change, 50)
 
 
     def set_server_callback(self, handle):
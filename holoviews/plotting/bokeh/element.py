@@ -21,7 +21,7 @@ from bokeh.plotting.helpers import _known_tools as known_tools
 from ...core import Store, DynamicMap, CompositeOverlay, Element, Dimension
 from ...core.options import abbreviated_exception, SkipRendering
 from ...core import util
-from ...streams import Stream
+from ...streams import Stream, Buffer
 from ..plot import GenericElementPlot, GenericOverlayPlot
 from ..util import dynamic_update
 from .plot import BokehPlot, TOOLS
@@ -805,6 +805,48 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         return plot
 
 
+    def _stream_datasource(self, source, data):
+        """
+        If the update was triggered by rows appended to a Buffer
+        stream, streams only the new rows to the datasource, rolling
+        over the oldest rows beyond the Buffer length. The rows
+        retained after the rollover must match the rows already in
+        the datasource, otherwise the element data was transformed and
+        is replaced in full. Returns whether the data was streamed.
+        """
+        buffers = [s for s in self.streams if isinstance(s, Buffer)
+                   and s.chunk_size is not None]
+        if len(buffers) != 1 or not source.data or set(source.data) != set(data):
+            return False
+        buff = buffers[0]
+        columns = list(data.values())
+        if not all(isinstance(c, np.ndarray) and c.ndim == 1 for c in columns):
+            return False
+        lengths = {len(c) for c in source.data.values()}
+        new_lengths = {len(c) for c in columns}
+        if len(lengths) != 1 or len(new_lengths) != 1:
+            return False
+        old_length = lengths.pop()
+        new_length = min(old_length+buff.chunk_size, buff.length)
+        if new_lengths.pop() != new_length:
+            return False
+        retained = new_length - buff.chunk_size
+        for k, new in data.items():
+            old = np.asarray(source.data[k])[old_length-retained:]
+            new = new[:retained]
+            if old.dtype != new.dtype:
+                return False
+            equal = old == new
+            if new.dtype.kind in 'fc':
+                equal |= np.isnan(old) & np.isnan(new)
+            if not np.all(equal):
+                return False
+        if buff.chunk_size:
+            source.stream({k: v[-buff.chunk_size:] for k, v in data.items()},
+                          rollover=buff.length)
+        return True
+
+
     def _update_glyphs(self, element, ranges):
         plot = self.handles['plot']
         glyph = self.handles.get('glyph')
@@ -824,7 +866,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         else:
             data, mapping = self.get_data(element, ranges)
 
-        if not self.static_source:
+        if not self.static_source and not self._stream_datasource(source, data):
             self._update_datasource(source, data)
 
         if glyph:
@@ -74,6 +74,10 @@ class BokehPlot(DimensionedPlot):
 
     backend = 'bokeh'
 
+    # Maximum fraction of rows which may change for a datasource update
+    # to be sent as a patch rather than replacing the columns
+    _patch_threshold = 0.5
+
     @property
     def document(self):
         return self._document
@@ -113,19 +117,20 @@ class BokehPlot(DimensionedPlot):
         if self.comm is None:
             raise Exception('Renderer does not have a comm.')
 
-        if bokeh_version > '0.12.9':
-            msg = self.renderer.diff(self, binary=True)
-            if msg is None:
-                return
-            self.comm.send(msg.header_json)
-            self.comm.send(msg.metadata_json)
-            self.comm.send(msg.content_json)
-            for header, payload in msg.buffers:
-                self.comm.send(json.dumps(header))
-                self.comm.send(buffers=[payload])
-        else:
-            diff = self.renderer.diff(self)
-            self.comm.send(diff)
+        with self.comm.measure():
+            if bokeh_version > '0.12.9':
+                msg = self.renderer.diff(self, binary=True)
+                if msg is None:
+                    return
+                self.comm.send(msg.header_json)
+                self.comm.send(msg.metadata_json)
+                self.comm.send(msg.content_json)
+                for header, payload in msg.buffers:
+                    self.comm.send(json.dumps(header))
+                    self.comm.send(buffers=[payload])
+            else:
+                diff = self.renderer.diff(self)
+                self.comm.send(diff)
 
 
     def set_root(self, root):
@@ -145,9 +150,43 @@ class BokehPlot(DimensionedPlot):
 
     def _update_datasource(self, source, data):
         """
-        Update datasource with data for a new frame.
+        Update datasource with data for a new frame, sending only the
+        changed rows as a patch if few rows changed in place.
+        """
+        if not self._patch_datasource(source, data):
+            source.data.update(data)
+
+
+    def _patch_datasource(self, source, data):
+        """
+        Patches the rows of the datasource which differ from the new
+        data if all columns are flat arrays of unchanged shape and
+        dtype and the fraction of changed rows is below the patch
+        threshold. Datetime columns are never patched since the
+        patched values would bypass bokeh's datetime conversion.
+        Returns whether the source was patched.
         """
-        source.data.update(data)
+        current = source.data
+        if not current or set(current) != set(data):
+            return False
+        patches = {}
+        for k, new in data.items():
+            old = current[k]
+            if not (isinstance(old, np.ndarray) and isinstance(new, np.ndarray)
+                    and old.ndim == 1 and old.shape == new.shape
+                    and old.dtype == new.dtype and new.dtype.kind in 'biufcUS'):
+                return False
+            changed = old != new
+            if new.dtype.kind in 'fc':
+                changed &= ~(np.isnan(old) & np.isnan(new))
+            indices = np.flatnonzero(changed)
+            if len(indices) > len(new)*self._patch_threshold:
+                return False
+            elif len(indices):
+                patches[k] = list(zip(indices.tolist(), new[indices].tolist()))
+        if patches:
+            source.patch(patches)
+        return True
 
     @property
     def state(self):
@@ -19,7 +19,7 @@ from ..plot import Plot, GenericElementPlot
 from ..renderer import Renderer, MIME_TYPES
 from .widgets import BokehScrubberWidget, BokehSelectionWidget, BokehServerWidgets
 from .util import (compute_static_patch, serialize_json, attach_periodic,
-                   bokeh_version, compute_plot_size)
+                   attach_async, bokeh_version, compute_plot_size)
 
 if bokeh_version > '0.12.9':
     from bokeh.io.notebook import (load_notebook, publish_display_data,
@@ -217,6 +217,7 @@ class BokehRenderer(Renderer):
             plot = plot.plot
         plot.document = doc
         plot.traverse(lambda x: attach_periodic(x), [GenericElementPlot])
+        plot.traverse(lambda x: attach_async(x), [GenericElementPlot])
         doc.add_root(root)
         return doc
 
@@ -36,7 +36,8 @@ from ...core.overlay import Overlay
 from ...core.util import basestring, unique_array, callable_name, pd, dt64_to_dt
 from ...core.spaces import get_nested_dmaps, DynamicMap
 
-from ..util import dim_axis_label, rgb2hex
+from ..util import (dim_axis_label, rgb2hex, colormap_lut,
+                    quantize_colors, rgba_to_hex)
 
 # Conversion between matplotlib and bokeh markers
 markers = {'s': {'marker': 'square'},
@@ -77,9 +78,12 @@ def mplcmap_to_palette(cmap, ncolors=None):
         raise ValueError("Using cmaps on objects requires matplotlib.")
     with abbreviated_exception():
         colormap = cm.get_cmap(cmap) #choose any matplotlib colormap here
+        lut = (colormap_lut(colormap)*255).astype(np.uint8)
         if ncolors:
-            return [rgb2hex(colormap(i)) for i in np.linspace(0, 1, ncolors)]
-        return [rgb2hex(m) for m in colormap(np.arange(colormap.N))]
+            indices = quantize_colors(np.linspace(0, 1, ncolors), colormap.N)
+        else:
+            indices = np.arange(colormap.N)
+        return rgba_to_hex(lut[indices]).tolist()
 
 
 def get_cmap(cmap):
@@ -780,6 +784,17 @@ def attach_periodic(plot):
     return plot.hmap.traverse(append_refresh, [DynamicMap])
 
 
+def attach_async(plot):
+    """
+    Schedules the plot refreshes following asynchronous DynamicMap
+    evaluations on the event loop of the plot's bokeh Document.
+    """
+    def append_schedule(dmap):
+        for dmap in get_nested_dmaps(dmap):
+            dmap._async_schedule = plot.document.add_next_tick_callback
+    return plot.hmap.traverse(append_schedule, [DynamicMap])
+
+
 def date_to_integer(date):
     """
     Converts datetime types to bokeh's integer format.
@@ -235,6 +235,9 @@ class BokehWidget(NdWidget):
     extensionjs = param.String(default='bokehwidgets.js', doc="""
         Optional javascript extension file for a particular backend.""")
 
+    # Frames are patches against the models of this widget's document
+    _parallel_render = False
+
     def _get_data(self):
         # Get initial frame to draw immediately
         init_frame = self._plot_figure(0, fig_format='html')
@@ -244,7 +247,7 @@ class BokehWidget(NdWidget):
     def encode_frames(self, frames):
         if self.export_json:
             self.save_json(frames)
-            frames = {}
+            frames = json.dumps({})
         else:
             frames = json.dumps(frames).replace('</', r'<\/')
         return frames
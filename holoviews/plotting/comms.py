@@ -2,6 +2,10 @@ import json
 import uuid
 import sys
 import traceback
+from contextlib import contextmanager
+from functools import partial
+
+import numpy as np
 
 try:
     from StringIO import StringIO
@@ -9,6 +13,109 @@ except:
     from io import StringIO
 
 
+# Maps NumPy dtypes to the dtypes that may be transferred as raw
+# buffers and decoded into JavaScript TypedArrays
+BINARY_DTYPES = {'b': 'bool', 'i1': 'int8', 'i2': 'int16', 'i4': 'int32',
+                 'u1': 'uint8', 'u2': 'uint16', 'u4': 'uint32',
+                 'f2': 'float32', 'f4': 'float32', 'f8': 'float64',
+                 'i8': 'float64', 'u8': 'float64'}
+
+
+def _binary_array(arr, buffers):
+    """
+    Appends the array to the buffers as a little-endian, C-contiguous
+    buffer and returns the header referencing it, or None if the
+    array dtype cannot be transferred as a buffer.
+    """
+    key = 'b' if arr.dtype.kind == 'b' else arr.dtype.kind+str(arr.dtype.itemsize)
+    dtype = BINARY_DTYPES.get(key)
+    if dtype is None:
+        return None
+    elif key in ('i8', 'u8') and arr.size and (arr.max() > 2**53 or arr.min() < -2**53):
+        # Integers beyond the float64 mantissa would lose precision
+        return None
+    target = np.uint8 if dtype == 'bool' else np.dtype(dtype)
+    arr = np.ascontiguousarray(arr, dtype=np.dtype(target).newbyteorder('<'))
+    buffers.append(memoryview(arr.reshape(-1).view(np.uint8)))
+    return {'__buffer__': len(buffers)-1, 'dtype': dtype, 'shape': list(arr.shape)}
+
+
+def _replace_arrays(obj, buffers):
+    if isinstance(obj, dict):
+        return {k: _replace_arrays(v, buffers) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_replace_arrays(v, buffers) for v in obj]
+    elif sys.version_info[0] > 2 and isinstance(obj, bytes):
+        # On Python 2 bytes cannot be distinguished from strings
+        buffers.append(memoryview(obj))
+        return {'__buffer__': len(buffers)-1, 'dtype': 'bytes'}
+    elif isinstance(obj, np.ndarray):
+        header = _binary_array(obj, buffers)
+        return obj.tolist() if header is None else header
+    return obj
+
+
+def _nbytes(buf):
+    view = memoryview(buf)
+    return getattr(view, 'nbytes', len(view)*view.itemsize)
+
+
+def encode_binary(obj, cls=None):
+    """
+    Encodes an object for transfer across a Comm, replacing the NumPy
+    arrays and (on Python 3) bytes nested in dictionaries, lists and
+    tuples with headers referencing raw binary buffers. Numeric arrays
+    are sent as little-endian buffers along with their dtype and
+    shape, 64-bit integers are cast to float64 since JavaScript has no
+    equivalent TypedArray, unless they cannot be represented exactly,
+    in which case they are sent as lists. The remaining content is
+    serialized to JSON using the supplied JSONEncoder class.
+
+    Returns the message to send and the list of buffers, which are
+    decoded by the JS code included in the JupyterComm templates.
+    """
+    buffers = []
+    content = _replace_arrays(obj, buffers)
+    return {'__binary__': json.dumps(content, cls=cls)}, buffers
+
+
+# Decodes messages encoded using encode_binary, returning other
+# messages unchanged. Numeric arrays are decoded into TypedArrays,
+# multi-dimensional arrays into nested Arrays of TypedArray rows.
+JS_BINARY_DECODER = """
+function hv_decode_binary(data, buffers) {
+  if ((data == null) || (data.__binary__ === undefined)) {
+    return data;
+  }
+  var types = {bool: Uint8Array, int8: Int8Array, int16: Int16Array,
+               int32: Int32Array, uint8: Uint8Array, uint16: Uint16Array,
+               uint32: Uint32Array, float32: Float32Array, float64: Float64Array};
+  function nest(arr, shape) {
+    if (shape.length <= 1) { return arr; }
+    var size = arr.length / shape[0], rows = [];
+    for (var i = 0; i < shape[0]; i++) {
+      rows.push(nest(arr.subarray(i*size, (i+1)*size), shape.slice(1)));
+    }
+    return rows;
+  }
+  return JSON.parse(data.__binary__, function(key, value) {
+    if ((value == null) || (value.__buffer__ === undefined)) {
+      return value;
+    }
+    var view = buffers[value.__buffer__];
+    var buffer = (view.buffer === undefined) ? view :
+      view.buffer.slice(view.byteOffset, view.byteOffset+view.byteLength);
+    if (value.dtype == 'bytes') {
+      return buffer;
+    }
+    return nest(new types[value.dtype](buffer), value.shape);
+  });
+}
+"""
+
+_JS_DECODER = JS_BINARY_DECODER.replace('{', '{{').replace('}', '}}')
+
+
 class StandardOutput(list):
     """
     Context manager to capture standard output for any code it
@@ -59,6 +166,8 @@ class Comm(object):
         self._plot = plot
         self._on_msg = on_msg
         self._comm = None
+        self._stats = {'messages': 0, 'bytes': 0, 'pushes': 0,
+                       'last_push_bytes': 0}
 
 
     def init(self, on_msg=None):
@@ -71,6 +180,59 @@ class Comm(object):
         """
         Sends data to the frontend
         """
+        self._record(data, buffers)
+
+
+    def send_binary(self, data, cls=None):
+        """
+        Sends data to the frontend transferring any NumPy arrays and
+        bytes nested in it as binary buffers, see encode_binary.
+        """
+        msg, buffers = encode_binary(data, cls)
+        self.send(msg, buffers=buffers)
+
+
+    def _record(self, data, buffers):
+        """
+        Records the number of bytes in a message sent to the frontend.
+        """
+        if data is None:
+            nbytes = 0
+        elif isinstance(data, bytes):
+            nbytes = len(data)
+        elif isinstance(data, dict) and '__binary__' in data:
+            # Content of binary messages is already encoded
+            nbytes = len(data['__binary__'].encode('utf-8'))
+        elif isinstance(data, (dict, list)):
+            nbytes = len(json.dumps(data).encode('utf-8'))
+        else:
+            nbytes = len(('%s' % data).encode('utf-8'))
+        nbytes += sum(_nbytes(b) for b in buffers)
+        self._stats['messages'] += 1
+        self._stats['bytes'] += nbytes
+
+
+    @contextmanager
+    def measure(self):
+        """
+        Context manager which records the messages sent inside it as
+        a single push, recording the number of bytes it sent.
+        """
+        start = self._stats['bytes']
+        try:
+            yield
+        finally:
+            self._stats['pushes'] += 1
+            self._stats['last_push_bytes'] = self._stats['bytes'] - start
+
+
+    @property
+    def stats(self):
+        """
+        Transfer statistics counting the messages and bytes sent, the
+        number of pushes and the bytes sent by the last push.
+        """
+        return dict(self._stats)
 
 
     @classmethod
@@ -95,28 +257,49 @@ class Comm(object):
         """
         comm_id = None
         try:
-            stdout = []
             msg = self.decode(msg)
             comm_id = msg.pop('comm_id', None)
-            if self._on_msg:
+        except Exception as e:
+            self._reply(self._error_reply(e, []), comm_id)
+            return
+        self.invoke(partial(self._on_msg, msg) if self._on_msg else None, comm_id)
+
+
+    def invoke(self, fn, comm_id=None):
+        """
+        Invokes the supplied function, sending its standard output or
+        the error it raised to the frontend in a reply acknowledging
+        the message with the supplied comm_id. Allows messages whose
+        handling was deferred to report their outcome.
+        """
+        stdout = []
+        try:
+            if fn is not None:
                 # Comm swallows standard output so we need to capture
                 # it and then send it to the frontend
                 with StandardOutput() as stdout:
-                    self._on_msg(msg)
+                    fn()
         except Exception as e:
-            frame =traceback.extract_tb(sys.exc_info()[2])[-2]
-            fname,lineno,fn,text = frame
-            error_kwargs = dict(type=type(e).__name__, fn=fn, fname=fname,
-                                line=lineno, error=str(e))
-            error = '{fname} {fn} L{line}\n\t{type}: {error}'.format(**error_kwargs)
-            if stdout:
-                stdout = '\n\t'+'\n\t'.join(stdout)
-                error = '\n'.join([stdout, error])
-            reply = {'msg_type': "Error", 'traceback': error}
+            reply = self._error_reply(e, stdout)
         else:
             stdout = '\n\t'+'\n\t'.join(stdout) if stdout else ''
             reply = {'msg_type': "Ready", 'content': stdout}
+        self._reply(reply, comm_id)
+
+
+    def _error_reply(self, e, stdout):
+        frame = traceback.extract_tb(sys.exc_info()[2])[-2]
+        fname,lineno,fn,text = frame
+        error_kwargs = dict(type=type(e).__name__, fn=fn, fname=fname,
+                            line=lineno, error=str(e))
+        error = '{fname} {fn} L{line}\n\t{type}: {error}'.format(**error_kwargs)
+        if stdout:
+            stdout = '\n\t'+'\n\t'.join(stdout)
+            error = '\n'.join([stdout, error])
+        return {'msg_type': "Error", 'traceback': error}
+
 
+    def _reply(self, reply, comm_id):
         # Returning the comm_id in an ACK message ensures that
         # the correct comms handle is unblocked
         if comm_id:
@@ -131,9 +314,9 @@ class JupyterComm(Comm):
     """
 
     template = """
-    <script>
+    <script>""" + _JS_DECODER + """
       function msg_handler(msg) {{
-        var msg = msg.content.data;
+        var msg = hv_decode_binary(msg.content.data, msg.buffers);
         {msg_handler}
       }}
 
@@ -171,6 +354,7 @@ class JupyterComm(Comm):
         """
         if not self._comm:
             self.init()
+        self._record(data, buffers)
         self.comm.send(data, buffers=buffers)
 
 
@@ -183,9 +367,9 @@ class JupyterCommJS(JupyterComm):
     """
 
     template = """
-    <script>
+    <script>""" + _JS_DECODER + """
       function msg_handler(msg) {{
-        var msg = msg.content.data;
+        var msg = hv_decode_binary(msg.content.data, msg.buffers);
         {msg_handler}
       }}
 
@@ -220,5 +404,6 @@ class JupyterCommJS(JupyterComm):
         """
         Pushes data across comm socket.
         """
+        self._record(data, buffers)
         self.comm.send(data, buffers=buffers)
 
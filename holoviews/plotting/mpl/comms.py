@@ -14,9 +14,18 @@ from ..comms import JupyterComm
 mpl_msg_handler = """
 /* Backend specific body of the msg_handler, updates displayed frame */
 target = $('#fig_{comm_id}');
-img = $('<div />').html(msg);
-target.children().each(function () {{ $(this).remove() }})
-target.append(img)
+if (typeof msg === 'string') {{
+  img = $('<div />').html(msg);
+  target.children().each(function () {{ $(this).remove() }})
+  target.append(img)
+}} else {{
+  /* Binary frame, replace the image source with the new data */
+  img = target.find('img')[0];
+  if (img.src.indexOf('blob:') == 0) {{
+    URL.revokeObjectURL(img.src);
+  }}
+  img.src = URL.createObjectURL(new Blob([msg.data], {{type: msg.mime_type}}));
+}}
 """
 
 class NbAggCommSocket(CommSocket):
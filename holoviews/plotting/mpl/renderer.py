@@ -1,9 +1,11 @@
 import sys
+import subprocess
 from io import BytesIO
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryFile
 from contextlib import contextmanager
 from itertools import chain
 
+import numpy as np
 import matplotlib as mpl
 from matplotlib import pyplot as plt
 from param.parameterized import bothmethod
@@ -16,12 +18,51 @@ from ..renderer import Renderer, MIME_TYPES
 from .comms import (JupyterComm, NbAggJupyterComm,
                     mpl_msg_handler)
 from .widgets import MPLSelectionWidget, MPLScrubberWidget
+from ..widgets import _forks_workers
 from .util import get_tight_bbox
 
 class OutputWarning(param.Parameterized):pass
 outputwarning = OutputWarning(name='Warning')
 
 
+# Plot instantiated by each worker process rasterizing animation frames
+_anim_worker = None
+
+def _init_anim_worker(renderer, obj):
+    """
+    Instantiates the plot used by a worker process to rasterize
+    animation frames. Any exception is stored and returned for each
+    frame, since a failing initializer would otherwise be restarted
+    indefinitely by the pool.
+    """
+    global _anim_worker
+    try:
+        _anim_worker = renderer.get_plot(obj, renderer=renderer)
+    except Exception as e:
+        _anim_worker = e
+
+def _render_anim_frame(idx):
+    """
+    Renders the frame at the supplied index returning an RGBA array
+    cropped to even dimensions as required by most video codecs.
+    Like the matplotlib animation writers, frames are rendered at
+    the renderer dpi without computing a tight bounding box.
+    """
+    plot = _anim_worker
+    if isinstance(plot, Exception):
+        return plot
+    with mpl.rc_context(rc=plot.fig_rcparams):
+        plot.update_frame(plot.keys[idx])
+        fig = plot.state
+        if plot.renderer.dpi is not None:
+            fig.set_dpi(plot.renderer.dpi)
+        fig.canvas.draw()
+        width, height = fig.canvas.get_width_height()
+        rgba = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8)
+        rgba = rgba.reshape(height, width, 4)
+    return np.array(rgba[:height - height % 2, :width - width % 2])
+
+
 class MPLRenderer(Renderer):
     """
     Exporter used to render data from matplotlib, either to a stream
@@ -60,6 +101,11 @@ class MPLRenderer(Renderer):
                                 objects=['default', 'nbagg'], doc="""
          The 'nbagg' mode uses matplotlib's nbagg backend. """)
 
+    processes = param.Integer(default=1, bounds=(1, None), doc="""
+        Number of worker processes used to rasterize the frames of
+        webm, mp4 and gif animations. Each worker holds its own plot
+        and the RGBA frames are piped to a single encoder in order.""")
+
     # <format name> : (animation writer, format,  anim_kwargs, extra_args)
     ANIMATION_OPTS = {
         'webm': ('ffmpeg', 'webm', {},
@@ -102,9 +148,14 @@ class MPLRenderer(Renderer):
         else:
             if sys.version_info[0] == 3 and mpl.__version__[:-2] in ['1.2', '1.3']:
                 raise Exception("<b>Python 3 matplotlib animation support broken &lt;= 1.3</b>")
-            with mpl.rc_context(rc=plot.fig_rcparams):
-                anim = plot.anim(fps=self.fps)
-            data = self._anim_data(anim, fmt)
+            data = None
+            if (self.processes > 1 and fmt in ['webm', 'mp4', 'gif'] and
+                len(plot) > 1 and _forks_workers()):
+                data = self._parallel_anim_data(plot, fmt)
+            if data is None:
+                with mpl.rc_context(rc=plot.fig_rcparams):
+                    anim = plot.anim(fps=self.fps)
+                data = self._anim_data(anim, fmt)
 
         data = self._apply_post_render_hooks(data, obj, fmt)
         return data, {'file-ext':fmt,
@@ -167,9 +218,11 @@ class MPLRenderer(Renderer):
         return (int(w*dpi), int(h*dpi))
 
 
-    def diff(self, plot):
+    def diff(self, plot, binary=False):
         """
-        Returns the latest plot data to update an existing plot.
+        Returns the latest plot data to update an existing plot. If
+        binary is enabled png and svg figures are returned as raw
+        bytes along with their mime type instead of embedded in HTML.
         """
         data = None
         if self.mode != 'nbagg':
@@ -177,6 +230,11 @@ class MPLRenderer(Renderer):
                 figure_format = self.params('fig').objects[0]
             else:
                 figure_format = self.fig
+            if binary and figure_format in ['png', 'svg']:
+                figdata, info = self(plot, figure_format)
+                if not isinstance(figdata, bytes):
+                    figdata = figdata.encode('utf-8')
+                return {'mime_type': info['mime_type'], 'data': figdata}
             data = self.html(plot, figure_format, comm=False)
         return data
 
@@ -241,6 +299,72 @@ class MPLRenderer(Renderer):
         return video
 
 
+    def _parallel_anim_data(self, plot, fmt):
+        """
+        Render the frames of the plot on a pool of worker processes,
+        piping the raw RGBA frames in order to the stdin of a single
+        encoder process and return the encoded animation data. Returns
+        None if the frames differ in size, in which case the animation
+        has to be rendered serially.
+        """
+        from multiprocessing import Pool
+        from .plot import CompositePlot
+
+        obj = plot.layout if isinstance(plot, CompositePlot) else plot.hmap
+        indices = list(range(len(plot)))
+        chunksize = max(1, len(indices) // (self.processes*8))
+        pool = Pool(self.processes, _init_anim_worker, (self, obj))
+        encoder = None
+        try:
+            # The encoder output is written to a file rather than a pipe
+            # which is not drained while frames are written to stdin
+            with NamedTemporaryFile(suffix='.%s' % fmt) as f, TemporaryFile() as log:
+                for frame in pool.imap(_render_anim_frame, indices, chunksize):
+                    if isinstance(frame, Exception):
+                        raise frame
+                    elif encoder is None:
+                        size = frame.shape[:2]
+                        cmd = self._encoder_command(fmt, size[::-1], f.name)
+                        encoder = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                                   stdout=log, stderr=log)
+                    elif frame.shape[:2] != size:
+                        return None
+                    encoder.stdin.write(frame.tobytes())
+                if encoder is None:
+                    raise ValueError('No animation frames were rendered.')
+                encoder.communicate()
+                if encoder.returncode:
+                    log.seek(0)
+                    raise IOError('Animation encoder exited with code %d:\n%s'
+                                  % (encoder.returncode, log.read().decode('utf-8', 'replace')))
+                video = open(f.name, "rb").read()
+            pool.close()
+        finally:
+            if encoder is not None and encoder.returncode is None:
+                encoder.kill()
+                encoder.wait()
+            pool.terminate()
+            pool.join()
+        return video
+
+
+    def _encoder_command(self, fmt, size, filename):
+        """
+        Returns the command line of the encoder reading raw RGBA
+        frames of the given (width, height) from stdin.
+        """
+        (writer, _, anim_kwargs, extra_args) = self.ANIMATION_OPTS[fmt]
+        fps = max([int(self.fps), 1]) if self.fps is not None else anim_kwargs.get('fps', 5)
+        if writer == 'imagemagick':
+            return [mpl.rcParams['animation.convert_path'], '-size', '%dx%d' % size,
+                    '-depth', '8', '-delay', str(100./fps), '-loop', '0',
+                    'rgba:-', filename]
+        codec = ['-vcodec', anim_kwargs['codec']] if 'codec' in anim_kwargs else []
+        return ([mpl.rcParams['animation.ffmpeg_path'], '-f', 'rawvideo',
+                 '-vcodec', 'rawvideo', '-s', '%dx%d' % size, '-pix_fmt', 'rgba',
+                 '-r', str(fps), '-i', 'pipe:'] + codec + extra_args + ['-y', filename])
+
+
     def _compute_bbox(self, fig, kw):
         """
         Compute the tight bounding box for each figure once, reducing
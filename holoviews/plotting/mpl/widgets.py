@@ -42,7 +42,7 @@ class MPLWidget(NdWidget):
     def encode_frames(self, frames):
         if self.export_json:
             self.save_json(frames)
-            return {}
+            return json.dumps({})
         elif not isinstance(frames, dict):
             pass
         else:
@@ -165,6 +165,10 @@ class DimensionedPlot(Plot):
                       'title', 'legend', 'legend_title', 'xticks',
                       'yticks']
 
+    # Memoized normalization options keyed on the backend and the set
+    # of element specs, valid for a single Store.options_version
+    _norm_opts_cache = (None, {})
+
     show_title = param.Boolean(default=True, doc="""
         Whether to display the plot title.""")
 
@@ -363,14 +367,32 @@ class DimensionedPlot(Plot):
         Returns a dictionary of normalization options for each
         element in the tree.
         """
-        norm_opts = {}
-
         # Get all elements' type.group.label specs and ids
         type_val_fn = lambda x: (x.id, (type(x).__name__, util.group_sanitizer(x.group, escape=False),
                                         util.label_sanitizer(x.label, escape=False))) \
             if isinstance(x, Element) else None
-        element_specs = {(idspec[0], idspec[1]) for idspec in obj.traverse(type_val_fn)
-                         if idspec is not None}
+        element_specs = frozenset((idspec[0], idspec[1]) for idspec in obj.traverse(type_val_fn)
+                                  if idspec is not None)
+
+        # Reuse the resolved options unless the option trees changed
+        backend = self.renderer.backend
+        version, cache = DimensionedPlot._norm_opts_cache
+        if version != Store.options_version:
+            cache = {}
+            DimensionedPlot._norm_opts_cache = (Store.options_version, cache)
+        key = (backend, element_specs)
+        if key not in cache:
+            cache[key] = self._resolve_norm_opts(element_specs, backend)
+        return dict(cache[key])
+
+
+    @staticmethod
+    def _resolve_norm_opts(element_specs, backend):
+        """
+        Resolves the normalization options for the supplied set of
+        (id, spec) tuples against the OptionTrees of the backend.
+        """
+        norm_opts = {}
 
         # Group elements specs by ID and override normalization
         # options sequentially
@@ -380,7 +402,6 @@ class DimensionedPlot(Plot):
             gid = None if gid == -1 else gid
             group_specs = [el for _, el in element_spec_group]
 
-            backend = self.renderer.backend
             optstree = Store.custom_options(
                 backend=backend).get(gid, Store.options(backend=backend))
             # Get the normalization options for the current id
@@ -516,8 +537,12 @@ class DimensionedPlot(Plot):
         """
         if self.comm is None:
             raise Exception('Renderer does not have a comm.')
-        diff = self.renderer.diff(self)
-        self.comm.send(diff)
+        with self.comm.measure():
+            diff = self.renderer.diff(self, binary=True)
+            if isinstance(diff, dict):
+                self.comm.send_binary(diff, self.renderer.json_encoder)
+            else:
+                self.comm.send(diff)
 
 
     def init_comm(self):
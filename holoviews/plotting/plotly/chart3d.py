@@ -13,6 +13,7 @@ except ImportError:
 import param
 
 from ...core.options import SkipRendering
+from ..util import colormap_lut, quantize_colors
 from .element import ElementPlot, ColorbarPlot
 from .chart import ScatterPlot
 
@@ -110,7 +111,8 @@ class TrisurfacePlot(ColorbarPlot, Chart3DPlot):
                 opts['colormap'] = colors.PLOTLY_SCALES[cmap]
             else:
                 cmap = get_cmap(cmap)
-                opts['colormap'] = [cmap(i) for i in np.linspace(0, 1)]
+                indices = quantize_colors(np.linspace(0, 1), cmap.N)
+                opts['colormap'] = [tuple(c) for c in colormap_lut(cmap)[indices]]
         return opts
 
     def init_graph(self, plot_args, plot_kwargs):
@@ -14,9 +14,20 @@ PlotlyScrubberWidget.prototype = Object.create(ScrubberWidget.prototype);
 // Define methods to override on widgets
 var PlotlyMethods = {
     init_slider : function(init_val){
+		if (this.load_json) {
+			this.from_json();
+			return
+		}
 		$.each(this.frames, $.proxy(function(index, frame) {
 			this.frames[index] = JSON.parse(frame);
 		}, this));
+    },
+    update_cache : function(){
+		$.each(this.frames, $.proxy(function(index, frame) {
+			if (typeof frame === 'string') {
+				this.frames[index] = JSON.parse(frame);
+			}
+		}, this));
     },
 	process_msg : function(msg) {
 		var data = JSON.parse(msg.content.data);
@@ -14,10 +14,19 @@ from .widgets import PlotlyScrubberWidget, PlotlySelectionWidget
 plotly_msg_handler = """
 /* Backend specific body of the msg_handler, updates displayed frame */
 var plot = $('#{comm_id}')[0];
-var data = JSON.parse(msg);
+var data = (typeof msg === 'string') ? JSON.parse(msg) : msg;
+/* Convert binary TypedArrays to plain Arrays supported by plotly.js */
+function to_array(value) {{
+  if (ArrayBuffer.isView(value)) {{
+    return Array.prototype.slice.call(value);
+  }} else if (Array.isArray(value)) {{
+    return value.map(to_array);
+  }}
+  return value;
+}}
 $.each(data.data, function(i, obj) {{
   $.each(Object.keys(obj), function(j, key) {{
-    plot.data[i][key] = obj[key];
+    plot.data[i][key] = to_array(obj[key]);
   }});
 }});
 Plotly.relayout(plot, data.layout);
@@ -50,6 +59,8 @@ class PlotlyRenderer(Renderer):
 
     comms = {'default': (JupyterComm, plotly_msg_handler)}
 
+    json_encoder = utils.PlotlyJSONEncoder
+
     _loaded = False
 
     def __call__(self, obj, fmt='html', divuuid=None):
@@ -64,14 +75,15 @@ class PlotlyRenderer(Renderer):
             return self.diff(plot), mime_types
 
 
-    def diff(self, plot, serialize=True):
+    def diff(self, plot, serialize=True, binary=False):
         """
         Returns a json diff required to update an existing plot with
-        the latest plot data.
+        the latest plot data. If binary is enabled the diff is returned
+        unserialized to allow sending arrays as binary buffers.
         """
         diff = {'data': plot.state.get('data', []),
                 'layout': plot.state.get('layout', {})}
-        if serialize:
+        if serialize and not binary:
             return json.dumps(diff, cls=utils.PlotlyJSONEncoder)
         else:
             return diff
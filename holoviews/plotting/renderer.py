@@ -135,6 +135,10 @@ class Renderer(Exporter):
     # handler defines how the message is processed on the frontend
     comms = {'default': (JupyterComm, None)}
 
+    # The JSONEncoder class used to serialize the content of binary
+    # Comm messages alongside the binary buffers
+    json_encoder = None
+
     # Define appropriate widget classes
     widgets = {'scrubber': ScrubberWidget, 'widgets': SelectionWidget}
 
@@ -157,6 +161,16 @@ class Renderer(Exporter):
         super(Renderer, self).__init__(**params)
 
 
+    def __getstate__(self):
+        """
+        Excludes the last rendered plot when pickling the renderer,
+        e.g. when handing it to worker processes.
+        """
+        state = super(Renderer, self).__getstate__()
+        state['last_plot'] = None
+        return state
+
+
     @bothmethod
     def get_plot(self_or_cls, obj, renderer=None):
         """
@@ -384,10 +384,75 @@ def closest_match(match, specs, depth=0):
             return sorted(match_lengths, key=lambda x: -x[1])[0][0]
 
 
+def colormap_lut(cmap):
+    """
+    Returns an RGBA lookup table of shape (N+3, 4) for the supplied
+    matplotlib colormap, containing the N colormap entries followed
+    by the under, over and bad colors.
+    """
+    N = cmap.N
+    lut = np.empty((N+3, 4))
+    lut[:N+2] = cmap(np.arange(-1, N+1))[np.r_[1:N+1, 0, N+1]]
+    # Unmasked NaNs map to the under color on older matplotlib versions
+    lut[N+2] = cmap(np.ma.masked_invalid([np.nan]))[0]
+    return lut
+
+
+def quantize_colors(arr, N):
+    """
+    Quantizes normalized values in the range 0-1 (or integer indices)
+    to indices into a lookup table returned by colormap_lut, mapping
+    out of range values to the under and over entries and non-finite
+    values to the bad entry.
+    """
+    arr = np.asarray(arr)
+    if arr.dtype.kind in 'iu':
+        indices = arr.astype(np.intp)
+        indices[arr < 0] = N
+        indices[arr >= N] = N+1
+        return indices
+    arr = np.ma.filled(np.ma.asarray(arr, dtype=np.float64), np.nan)*N
+    arr[arr == N] = N-1
+    with np.errstate(invalid='ignore'):
+        under, over = arr < 0, arr >= N
+    bad = ~np.isfinite(arr)
+    indices = np.clip(np.nan_to_num(arr), 0, N-1).astype(np.intp)
+    indices[under] = N
+    indices[over] = N+1
+    indices[bad] = N+2
+    return indices
+
+
+_hex_digits = np.array([[ord(c) for c in '%02x' % i] for i in range(256)], dtype=np.uint8)
+
+def rgba_to_hex(rgba):
+    """
+    Converts an array of uint8 RGB(A) values of shape (N, 3) or
+    (N, 4) to an array of RGB hex strings in a single vectorized
+    pass over a precomputed table of hex digits.
+    """
+    rgba = np.asarray(rgba, dtype=np.uint8)
+    chars = np.empty((len(rgba), 7), dtype=np.uint8)
+    chars[:, 0] = ord('#')
+    for i in range(3):
+        chars[:, 1+2*i:3+2*i] = _hex_digits[rgba[:, i]]
+    return chars.view('S7').ravel().astype('U7')
+
+
+def rgba_to_uint32(rgba):
+    """
+    Packs an array of uint8 RGBA values of shape (N, 4) into a uint32
+    array, e.g. as used by image_rgba glyphs.
+    """
+    return np.ascontiguousarray(rgba, dtype=np.uint8).view(np.uint32).ravel()
+
+
 def map_colors(arr, crange, cmap, hex=True):
     """
     Maps an array of values to RGB hex strings, given
-    a color range and colormap.
+    a color range and colormap. If hex is False an array
+    of RGBA floats is returned, if hex is 'uint32' the
+    colors are returned as packed uint32 RGBA values.
     """
     if isinstance(crange, np.ndarray):
         xsorted = np.argsort(crange)
@@ -399,14 +464,14 @@ def map_colors(arr, crange, cmap, hex=True):
         else:
             cmin, cmax = np.nanmin(arr), np.nanmax(arr)
         arr = (arr - cmin) / (cmax-cmin)
-        arr = np.ma.array(arr, mask=np.logical_not(np.isfinite(arr)))
-    arr = cmap(arr)
-    if hex:
-        arr *= 255
-        return ["#{0:02x}{1:02x}{2:02x}".format(*(int(v) for v in c[:-1]))
-                for c in arr]
-    else:
-        return arr
+    lut = colormap_lut(cmap)
+    indices = quantize_colors(arr, cmap.N)
+    if not hex:
+        return lut[indices]
+    rgba = (lut*255).astype(np.uint8)[indices]
+    if hex == 'uint32':
+        return rgba_to_uint32(rgba)
+    return rgba_to_hex(rgba).tolist()
 
 
 def dim_axis_label(dimensions, separator=', '):
@@ -440,12 +505,50 @@ def get_min_distance(element):
     """
     Gets the minimum sampling distance of the x- and y-coordinates
     in a grid.
-    """
-    xys = element.array([0, 1]).view(dtype=np.complex128)
-    m, n = np.meshgrid(xys, xys)
-    distances = np.abs(m-n)
-    np.fill_diagonal(distances, np.inf)
-    return distances[distances>0].min()
+
+    Regular grids are resolved from the unique coordinates along each
+    axis, while scattered points use a nearest neighbor query on a
+    KD-tree if SciPy is available and a sort based sweep otherwise,
+    avoiding the construction of a full distance matrix.
+    """
+    xys = element.array([0, 1]).astype(np.float64)
+    xys = np.ascontiguousarray(xys[np.isfinite(xys).all(axis=1)])
+    xys = np.unique(xys.view(dtype=np.complex128).ravel())
+    xys = np.column_stack([xys.real, xys.imag])
+    if len(xys) < 2:
+        raise ValueError('Minimum distance requires at least two '
+                         'distinct coordinates.')
+
+    # Regular grid fast path, the closest points are adjacent samples
+    xs, ys = np.unique(xys[:, 0]), np.unique(xys[:, 1])
+    if len(xs)*len(ys) == len(xys):
+        diffs = [np.diff(vals).min() for vals in (xs, ys) if len(vals) > 1]
+        return min(diffs)
+
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        return _sweep_min_distance(xys)
+    distances, _ = cKDTree(xys).query(xys, k=2)
+    return distances[:, 1].min()
+
+
+def _sweep_min_distance(xys):
+    """
+    Computes the minimum distance between distinct points by sorting
+    them along x and comparing each point against its successors
+    until the x-offset alone exceeds the smallest distance found.
+    """
+    xys = xys[np.argsort(xys[:, 0], kind='mergesort')]
+    xs, ys = xys[:, 0], xys[:, 1]
+    min_dist = np.inf
+    for offset in range(1, len(xys)):
+        dx = xs[offset:] - xs[:-offset]
+        if dx.min() >= min_dist:
+            break
+        dy = ys[offset:] - ys[:-offset]
+        min_dist = min(min_dist, np.hypot(dx, dy).min())
+    return min_dist
 
 
 def rgb2hex(rgb):
@@ -1,6 +1,6 @@
 from __future__ import unicode_literals
 
-import os, uuid, json, math
+import os, uuid, json, math, time
 
 import param
 import numpy as np
@@ -50,6 +50,43 @@ def escape_dict(vals):
 
 subdirs = [p[0] for p in os.walk(os.path.join(os.path.split(__file__)[0], '..'))]
 
+def _forks_workers():
+    """
+    Whether worker processes are forked, inheriting the renderer and
+    the plotted object instead of receiving them pickled.
+    """
+    import multiprocessing
+    if not hasattr(multiprocessing, 'get_start_method'):
+        return os.name == 'posix'
+    # The first of all start methods is the default if none is set
+    method = (multiprocessing.get_start_method(allow_none=True) or
+              multiprocessing.get_all_start_methods()[0])
+    return method == 'fork'
+
+
+# Widget instantiated by each worker process rendering embedded frames
+_frame_worker = None
+
+def _init_frame_worker(renderer, obj, widget_type, params):
+    """
+    Instantiates the plot and widget used by a worker process to
+    render embedded frames. Any exception is stored and returned for
+    each chunk, since a failing initializer would otherwise be
+    restarted indefinitely by the pool.
+    """
+    global _frame_worker
+    try:
+        plot = renderer.get_plot(obj, renderer=renderer)
+        _frame_worker = widget_type(plot, renderer=renderer, **params)
+    except Exception as e:
+        _frame_worker = e
+
+def _render_frame_chunk(indices):
+    if isinstance(_frame_worker, Exception):
+        return _frame_worker
+    return [(idx, _frame_worker._plot_figure(idx)) for idx in indices]
+
+
 class NdWidget(param.Parameterized):
     """
     NdWidget is an abstract base class implementing a method to find
@@ -85,6 +122,13 @@ class NdWidget(param.Parameterized):
          when exporting the notebook the path can be set to another
          location like a webserver where the json files can be uploaded to.""")
 
+    json_frames = param.Boolean(default=False, doc="""
+         If export_json is enabled, whether to stream each frame to a
+         separate file as it is rendered, stored in a subdirectory of
+         json_save_path named by the widget id. The widget JS code then
+         fetches the frames lazily as they are displayed, so neither
+         export nor display holds all frames in memory.""")
+
     ##############################
     # Javascript include options #
     ##############################
@@ -101,9 +145,27 @@ class NdWidget(param.Parameterized):
     extensionjs = param.String(default=None, doc="""
         Optional javascript extension file for a particular backend.""")
 
+    ###########################
+    # Embedded render options #
+    ###########################
+
+    processes = param.Integer(default=1, bounds=(1, None), doc="""
+        Number of worker processes used to render embedded frames.
+        Each worker holds its own plot instance and the rendered
+        frames are merged back in key order.""")
+
+    progress = param.Callable(default=None, doc="""
+        Optional callback invoked as each embedded frame is rendered,
+        with the number of completed frames, the total number of
+        frames and the estimated remaining time in seconds.""")
+
     widgets = {}
     counter = 0
 
+    # Whether frames may be rendered by independent plot instances,
+    # disabled where frames are patches against a shared document
+    _parallel_render = True
+
     def __init__(self, plot, renderer=None, **params):
         super(NdWidget, self).__init__(**params)
         self.id = plot.comm.id if plot.comm else uuid.uuid4().hex
@@ -146,6 +208,8 @@ class NdWidget(param.Parameterized):
         name = type(self).__name__
         cached = str(self.embed).lower()
         load_json = str(self.export_json).lower()
+        if self.export_json and self.json_frames:
+            load_json = "'frames'"
         mode = str(self.renderer.mode)
         json_path = (self.json_save_path if self.json_load_path is None
                      else self.json_load_path)
@@ -164,14 +228,66 @@ class NdWidget(param.Parameterized):
 
 
     def get_frames(self):
-        if self.embed:
-            frames = OrderedDict([(idx, self._plot_figure(idx))
-                                  for idx in range(len(self.plot))])
+        if self.embed and self.export_json and self.json_frames:
+            self.save_frames(self._render_frames())
+            return json.dumps({})
+        elif self.embed:
+            frames = OrderedDict(self._render_frames())
         else:
             frames = {}
         return self.encode_frames(frames)
 
 
+    def _render_frames(self):
+        """
+        Renders all frames of the plot yielding (index, frame) tuples
+        in key order, distributing the frames across a pool of worker
+        processes if enabled and supported by the multiprocessing
+        start method.
+        """
+        indices = list(range(len(self.plot)))
+        if (self.processes > 1 and self._parallel_render and
+            len(indices) > 1 and _forks_workers()):
+            rendered = self._parallel_frames(indices)
+        else:
+            rendered = ((idx, self._plot_figure(idx)) for idx in indices)
+
+        start = time.time()
+        for completed, frame in enumerate(rendered, 1):
+            yield frame
+            if self.progress is not None:
+                eta = (time.time()-start)/completed * (len(indices)-completed)
+                self.progress(completed, len(indices), eta)
+
+
+    def _parallel_frames(self, indices):
+        """
+        Renders the frames in chunks on a process pool, where each
+        worker instantiates its own plot and widget from the source
+        object. Yields (index, frame) tuples in key order.
+        """
+        from multiprocessing import Pool
+        from ..plot import GenericCompositePlot
+
+        obj = self.plot.layout if isinstance(self.plot, GenericCompositePlot) else self.plot.hmap
+        params = {k: v for k, v in self.get_param_values(onlychanged=True)
+                  if v is not None and k not in ['name', 'processes', 'progress']}
+        chunksize = max(1, len(indices) // (self.processes*8))
+        chunks = [indices[i:i+chunksize] for i in range(0, len(indices), chunksize)]
+        pool = Pool(self.processes, _init_frame_worker,
+                    (self.renderer, obj, type(self), params))
+        try:
+            for chunk in pool.imap(_render_frame_chunk, chunks):
+                if isinstance(chunk, Exception):
+                    raise chunk
+                for frame in chunk:
+                    yield frame
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+
     def encode_frames(self, frames):
         if isinstance(frames, dict):
             frames = dict(frames)
@@ -190,6 +306,22 @@ class NdWidget(param.Parameterized):
             json.dump(frames, f)
         self.json_data = frames
 
+    def save_frames(self, frames):
+        """
+        Writes each (index, frame) tuple to a separate json file in a
+        subdirectory of the json_path named with the widget uuid,
+        consuming the frames one at a time.
+        """
+        if self.json_save_path is None:
+            raise ValueError('Exporting json_frames requires a json_save_path '
+                             'to write the frames the widget loads to.')
+        path = os.path.join(self.json_save_path, self.id)
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        for idx, frame in frames:
+            with open(os.path.join(path, '%d.json' % idx), 'w') as f:
+                json.dump(frame, f)
+
     def _plot_figure(self, idx):
         with self.renderer.state():
             self.plot.update(idx)
@@ -24,6 +24,11 @@ HoloViewsWidget.prototype.process_error = function(msg){
 }
 
 HoloViewsWidget.prototype.from_json = function() {
+  if (this.load_json == 'frames') {
+    this.frames = {};
+    this.load_frame(0);
+    return
+  }
   var data_url = this.json_path + this.id + '.json';
   $.getJSON(data_url, $.proxy(function(json_data) {
     this.frames = json_data;
@@ -32,6 +37,20 @@ HoloViewsWidget.prototype.from_json = function() {
   }, this));
 }
 
+HoloViewsWidget.prototype.load_frame = function(current){
+  /* Lazily fetches frames exported to individual json files */
+  if ((this.load_json == 'frames') && !(current in this.frames) && !(current in this.cache)) {
+    var data_url = this.json_path + this.id + '/' + current + '.json';
+    $.getJSON(data_url, $.proxy(function(json_data) {
+      this.frames[current] = json_data;
+      this.update_cache();
+      this.update(current);
+    }, this));
+  } else {
+    this.update(current);
+  }
+}
+
 HoloViewsWidget.prototype.dynamic_update = function(current){
   if (current === undefined) {
     return
@@ -72,7 +91,7 @@ HoloViewsWidget.prototype.dynamic_update = function(current){
 HoloViewsWidget.prototype.update_cache = function(force){
   var frame_len = Object.keys(this.frames).length;
   for (var i=0; i<frame_len; i++) {
-    if(!this.load_json || this.dynamic)  {
+    if(!this.load_json || this.dynamic || this.load_json == 'frames')  {
       frame = Object.keys(this.frames)[i];
     } else {
       frame = i;
@@ -169,7 +188,7 @@ SelectionWidget.prototype.set_frame = function(dim_val, dim_idx){
     this.wait = true;
     this.dynamic_update(key)
   } else if (key !== undefined) {
-    this.update(key)
+    this.load_frame(key)
   }
 }
 
@@ -211,7 +230,7 @@ ScrubberWidget.prototype.set_frame = function(frame){
   }
   widget.value = this.current_frame;
   if(this.cached) {
-    this.update(frame)
+    this.load_frame(frame)
   } else {
     this.dynamic_update(frame)
   }
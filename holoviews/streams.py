@@ -4,10 +4,14 @@ generate and respond to events, originating either in Python on the
 server-side or in Javascript in the Jupyter notebook (client-side).
 """
 
+import time
+
 import param
 import numpy as np
 from numbers import Number
 from collections import defaultdict
+from functools import partial
+from threading import Lock
 from .core import util
 
 from contextlib import contextmanager
@@ -33,6 +37,146 @@ def triggering_streams(streams):
             stream._triggering = False
 
 
+class Throttle(object):
+    """
+    A Throttle limits the rate at which bursts of calls are passed on
+    to the supplied functions. A Throttle is called with a function
+    which is invoked or dropped according to the policy:
+
+    * 'leading': The function is invoked immediately unless the
+      previous invocation happened less than interval seconds ago, in
+      which case it is dropped.
+
+    * 'trailing': The function is invoked once no further calls have
+      been made for interval seconds, i.e. only the last call in a
+      burst is invoked.
+
+    * 'max-rate': The function is invoked immediately if interval
+      seconds have elapsed since the previous invocation, otherwise
+      it is deferred until they have, invoking only the latest of the
+      deferred calls. This limits invocations to one per interval
+      without dropping the final call in a burst.
+
+    Deferred calls are handed to the schedule function together with
+    the delay in seconds. By default they are scheduled on the tornado
+    IOLoop of the thread the Throttle was created on (e.g. the kernel
+    or server event loop), so they never run concurrently with other
+    events handled on that loop. If no event loop is running, e.g.
+    in a script, deferred calls are made synchronously instead. The
+    stats dictionary records the number of calls made and how many
+    were triggered or dropped.
+    """
+
+    policies = ['leading', 'trailing', 'max-rate']
+
+    def __init__(self, interval, policy='max-rate', schedule=None):
+        if policy not in self.policies:
+            raise ValueError('Throttle policy must be one of %s, not %r.'
+                             % (self.policies, policy))
+        self.interval = interval
+        self.policy = policy
+        self.schedule = self._schedule_on_loop if schedule is None else schedule
+        self._loop = util.current_ioloop() if schedule is None else None
+        self.stats = {'calls': 0, 'triggered': 0, 'dropped': 0}
+        self._lock = Lock()
+        self._last = None
+        self._deadline = None
+        self._pending = None
+        self._scheduled = False
+
+
+    def copy(self):
+        "Returns a new Throttle with the same policy and no state."
+        default = self.schedule == self._schedule_on_loop
+        return type(self)(self.interval, self.policy,
+                          None if default else self.schedule)
+
+
+    def _schedule_on_loop(self, fn, delay):
+        """
+        Default scheduler handing the deferred call back to the event
+        loop. Adding the callback is thread-safe, allowing calls made
+        from other threads to be deferred onto the loop. Without a
+        running loop the call is made synchronously once the delay has
+        elapsed, since it would otherwise never be made.
+        """
+        loop = self._loop
+        if loop is None or not util.ioloop_running(loop):
+            loop = util.current_ioloop()
+        if loop is None:
+            time.sleep(delay)
+            fn()
+        else:
+            loop.add_callback(loop.call_later, delay, fn)
+
+
+    def __call__(self, fn):
+        """
+        Invoke or defer the function according to the policy. Returns
+        whether the function was invoked immediately.
+        """
+        now = time.time()
+        delay = None
+        with self._lock:
+            self.stats['calls'] += 1
+            ready = self._last is None or (now - self._last) >= self.interval
+            if self.policy == 'leading':
+                if not ready:
+                    self.stats['dropped'] += 1
+                    return False
+                invoke = True
+            elif self.policy == 'max-rate':
+                invoke = ready and not self._scheduled
+            else:
+                invoke = False
+
+            if invoke:
+                self._last = now
+                self.stats['triggered'] += 1
+            else:
+                if self._pending is not None:
+                    self.stats['dropped'] += 1
+                self._pending = fn
+                if self.policy == 'trailing':
+                    self._deadline = now + self.interval
+                if not self._scheduled:
+                    self._scheduled = True
+                    if self.policy == 'trailing':
+                        delay = self.interval
+                    else:
+                        delay = max(self._last + self.interval - now, 0)
+        if invoke:
+            fn()
+        elif delay is not None:
+            self.schedule(self._flush, delay)
+        return invoke
+
+
+    def _flush(self):
+        """
+        Invokes the pending call once its deadline has passed.
+        """
+        with self._lock:
+            fn = self._pending
+            if fn is None:
+                self._scheduled = False
+                return
+            now = time.time()
+            if self.policy == 'trailing' and self._deadline > now:
+                delay = self._deadline - now
+                fn = None
+            else:
+                self._pending = None
+                self._scheduled = False
+                self._last = now
+                self.stats['triggered'] += 1
+        if fn is None:
+            self.schedule(self._flush, delay)
+        else:
+            fn()
+
+
+
 class Stream(param.Parameterized):
     """
     A Stream is simply a parameterized object with parameters that
@@ -124,7 +268,20 @@ class Stream(param.Parameterized):
         Passing multiple streams at once to trigger can be useful when a
         subscriber may be set multiple times across streams but only
         needs to be called once.
+
+        If any of the streams declare a throttle the subscribers are
+        only triggered once all the throttles let the event through.
         """
+        throttles = util.unique_iterator([s.throttle for s in streams
+                                          if s.throttle is not None])
+        trigger = partial(cls._trigger, streams)
+        for throttle in throttles:
+            trigger = partial(throttle, trigger)
+        trigger()
+
+
+    @classmethod
+    def _trigger(cls, streams):
         # Union of stream contents
         items = [stream.contents.items() for stream in streams]
         union = [kv for kvs in items for kv in kvs]
@@ -154,7 +311,7 @@ class Stream(param.Parameterized):
 
 
     def __init__(self, rename={}, source=None, subscribers=[], linked=False,
-                 transient=False, **params):
+                 transient=False, throttle=None, **params):
         """
         The rename argument allows multiple streams with similar event
         state to be used by remapping parameter names.
@@ -165,7 +322,14 @@ class Stream(param.Parameterized):
 
         Some streams are configured to automatically link to the source
         plot, to disable this set linked=False
+
+        The throttle limits the rate at which events trigger the
+        subscribers and may be supplied as a Throttle instance or as
+        the minimum interval between events in seconds.
         """
+        if isinstance(throttle, Number):
+            throttle = Throttle(throttle)
+        self.throttle = throttle
         self._source = source
         self._subscribers = []
         for subscriber in subscribers:
@@ -262,9 +426,20 @@ class Stream(param.Parameterized):
         specified name mapping.
         """
         params = {k:v for k,v in self.get_param_values() if k != 'name'}
+        throttle = None if self.throttle is None else self.throttle.copy()
         return self.__class__(rename=mapping,
                               source=self._source,
-                              linked=self.linked, **params)
+                              linked=self.linked,
+                              throttle=throttle, **params)
+
+    @property
+    def stats(self):
+        """
+        Event statistics recorded by the stream throttle, counting the
+        events and how many of them were triggered or dropped.
+        """
+        return None if self.throttle is None else dict(self.throttle.stats)
+
 
     @property
     def source(self):
@@ -297,6 +472,17 @@ class Stream(param.Parameterized):
                 if (self._rename.get(k,True) is not None)}
 
 
+    @property
+    def hashkey(self):
+        """
+        The stream contents as used to compute memoization keys. By
+        default this is the same as the contents but subclasses may
+        substitute cheap tokens for parameter values that should be
+        compared by reference rather than hashed.
+        """
+        return self.contents
+
+
     def _set_stream_parameters(self, **kwargs):
         """
         Sets the stream parameters which are expected to be declared
@@ -550,6 +736,144 @@ class Selection1D(LinkedStream):
         Indices into a 1D datastructure.""")
 
 
+class Pipe(Stream):
+    """
+    A Stream used to push arbitrary data to a DynamicMap callback,
+    e.g. to display the latest result computed by some external
+    process. Since the data may be arbitrarily large it is not hashed
+    when memoizing the callback, instead each send is treated as new
+    data and invokes the callback. Enabling memoize hashes the data
+    instead, skipping the callback when identical data is resent.
+
+    The send method may be called from multiple threads. Only one
+    thread triggers the subscribers at a time and data sent while an
+    update is in progress is coalesced, so that only the most recently
+    sent data is processed once the ongoing update completes.
+    """
+
+    data = param.Parameter(default=None, constant=True, doc="""
+        Arbitrary data being streamed to a DynamicMap callback.""")
+
+    def __init__(self, data=None, memoize=False, **params):
+        super(Pipe, self).__init__(data=data, **params)
+        self._memoize = memoize
+        self._lock = Lock()
+        self._pending = []
+        self._sending = False
+        # Incremented each time new data is supplied
+        self._version = 0
+
+
+    @property
+    def hashkey(self):
+        contents = self.contents
+        name = self._rename.get('data', 'data')
+        if name is None:
+            return contents
+        elif self._memoize:
+            contents[name] = util.deephash(self.data)
+        else:
+            contents[name] = (id(self), self._version)
+        return contents
+
+
+    def update(self, **kwargs):
+        if 'data' in kwargs:
+            self._version += 1
+        super(Pipe, self).update(**kwargs)
+
+
+    def send(self, data):
+        """
+        Sends the data to the subscribers of the stream. If another
+        thread is currently sending data, the data is queued and the
+        sending thread processes only the latest queued data once the
+        current update completes.
+        """
+        with self._lock:
+            self._pending[:] = [data]
+            if self._sending:
+                return
+            self._sending = True
+        try:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        self._sending = False
+                        return
+                    data = self._pending.pop()
+                self.event(data=data)
+        except:
+            with self._lock:
+                self._pending[:] = []
+                self._sending = False
+            raise
+
+
+
+class Buffer(Stream):
+    """
+    Buffer accumulates chunks of rows sent to it, holding at most
+    length rows and dropping the oldest rows as new ones arrive. The
+    data may be supplied as a dictionary of columns or as a pandas
+    DataFrame and every chunk sent must declare the same columns.
+
+    Plotting backends that support it may use the size of the most
+    recently appended chunk to stream only the new rows to the
+    frontend instead of replacing the data.
+    """
+
+    data = param.Parameter(default=None, constant=True, doc="""
+        The accumulated data, as a dictionary of column arrays or
+        as a pandas DataFrame.""")
+
+    length = param.Integer(default=1000, bounds=(1, None), constant=True, doc="""
+        The maximum number of rows held by the buffer.""")
+
+    def __init__(self, data, length=1000, **params):
+        if util.is_dataframe(data):
+            data = data.iloc[-length:]
+        else:
+            data = {k: np.asarray(v)[-length:] for k, v in data.items()}
+        # Number of rows appended by the event currently triggering
+        self.chunk_size = None
+        super(Buffer, self).__init__(data=data, length=length, **params)
+
+
+    @property
+    def contents(self):
+        # The length configures the buffer and is not passed to callbacks
+        contents = super(Buffer, self).contents
+        contents.pop(self._rename.get('length', 'length'), None)
+        return contents
+
+
+    def send(self, data):
+        """
+        Appends the supplied chunk of rows to the buffer, dropping the
+        oldest rows exceeding the buffer length, and triggers an event.
+        """
+        if util.is_dataframe(self.data):
+            if list(data.columns) != list(self.data.columns):
+                raise ValueError('Chunk columns %s do not match Buffer columns %s'
+                                 % (list(data.columns), list(self.data.columns)))
+            chunk_size = len(data)
+            data = util.pd.concat([self.data, data]).iloc[-self.length:]
+        else:
+            if set(data) != set(self.data):
+                raise ValueError('Chunk columns %s do not match Buffer columns %s'
+                                 % (sorted(data), sorted(self.data)))
+            data = {k: np.asarray(v) for k, v in data.items()}
+            chunk_size = len(data[list(data)[0]]) if data else 0
+            data = {k: np.concatenate([self.data[k], v])[-self.length:]
+                    for k, v in data.items()}
+        self.chunk_size = chunk_size
+        try:
+            self.event(data=data)
+        finally:
+            self.chunk_size = None
+
+
 class ParamValues(Stream):
     """
     A Stream based on the parameter values of some other parameterized
@@ -345,13 +345,15 @@ class Dynamic(param.ParameterizedFunction):
             def dynamic_operation(*key, **kwargs):
                 self.p.kwargs.update(kwargs)
                 return self._process(map_obj[key], key)
+        params = dict(inputs=[map_obj], link_inputs=self.p.link_inputs)
+        if isinstance(map_obj, DynamicMap):
+            # Memoize as many values as the input to chain efficiently
+            params['memoize_size'] = map_obj.callback.memoize_size
         if isinstance(self.p.operation, Operation):
-            return OperationCallable(dynamic_operation, inputs=[map_obj],
-                                     link_inputs=self.p.link_inputs,
-                                     operation=self.p.operation)
+            return OperationCallable(dynamic_operation,
+                                     operation=self.p.operation, **params)
         else:
-            return Callable(dynamic_operation, inputs=[map_obj],
-                            link_inputs=self.p.link_inputs)
+            return Callable(dynamic_operation, **params)
 
 
     def _make_dynamic(self, hmap, dynamic_fn, streams):
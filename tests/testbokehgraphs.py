@@ -62,7 +62,7 @@ class BokehGraphPlotTests(ComparisonTestCase):
         self.assertEqual(node_source.data['index'], self.source)
         self.assertEqual(edge_source.data['start'], self.source)
         self.assertEqual(edge_source.data['end'], self.target)
-        edges = graph.edgepaths.split()
+        edges = graph._split_edgepaths.split()
         self.assertEqual(edge_source.data['xs'], [path.dimension_values(0) for path in edges])
         self.assertEqual(edge_source.data['ys'], [path.dimension_values(1) for path in edges])
         layout = {z: (x, y) for x, y, z in self.graph.nodes.array()}
@@ -1,7 +1,11 @@
+import sys
 import json
+from unittest import SkipTest
+
+import numpy as np
 from nose.plugins.attrib import attr
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.plotting.comms import Comm, JupyterComm
+from holoviews.plotting.comms import Comm, JupyterComm, encode_binary
 
 
 class TestComm(ComparisonTestCase):
@@ -44,6 +48,78 @@ class TestComm(ComparisonTestCase):
         comm.send = assert_ready
         comm._handle_msg({'comm_id': 'Testing id'})
 
+    def test_send_records_bytes(self):
+        comm = Comm(None, id='Test')
+        comm.send('Test')
+        comm.send(buffers=[b'0123'])
+        self.assertEqual(comm.stats['messages'], 2)
+        self.assertEqual(comm.stats['bytes'], 8)
+
+    def test_measure_push_bytes(self):
+        comm = Comm(None, id='Test')
+        comm.send('Test')
+        with comm.measure():
+            comm.send('Test')
+            comm.send(buffers=[b'01'])
+        self.assertEqual(comm.stats['pushes'], 1)
+        self.assertEqual(comm.stats['last_push_bytes'], 6)
+
+    def test_send_binary_array_buffer(self):
+        comm = Comm(None, id='Test')
+        comm.send_binary({'x': np.arange(10, dtype='float64')})
+        self.assertTrue(comm.stats['bytes'] > 80)
+
+
+class TestEncodeBinary(ComparisonTestCase):
+
+    def test_encode_float_array(self):
+        arr = np.arange(6, dtype='>f8').reshape(2, 3)
+        msg, buffers = encode_binary({'x': arr, 'y': 'Test'})
+        content = json.loads(msg['__binary__'])
+        self.assertEqual(content, {'x': {'__buffer__': 0, 'dtype': 'float64',
+                                         'shape': [2, 3]}, 'y': 'Test'})
+        decoded = np.frombuffer(buffers[0].tobytes(), dtype='<f8')
+        self.assertEqual(decoded, np.arange(6, dtype='float64'))
+
+    def test_encode_int64_array_as_float64(self):
+        msg, buffers = encode_binary([np.arange(3)])
+        content = json.loads(msg['__binary__'])
+        self.assertEqual(content[0]['dtype'], 'float64')
+        decoded = np.frombuffer(buffers[0].tobytes(), dtype='<f8')
+        self.assertEqual(decoded, np.arange(3, dtype='float64'))
+
+    def test_encode_large_int64_array_as_list(self):
+        arr = np.array([0, 2**53+1], dtype='int64')
+        msg, buffers = encode_binary([arr])
+        content = json.loads(msg['__binary__'])
+        self.assertEqual(content, [[0, 2**53+1]])
+        self.assertEqual(buffers, [])
+
+    def test_encode_bool_array(self):
+        msg, buffers = encode_binary({'x': np.array([True, False])})
+        content = json.loads(msg['__binary__'])
+        self.assertEqual(content['x']['dtype'], 'bool')
+        self.assertEqual(buffers[0].tobytes(), b'\x01\x00')
+
+    def test_encode_bytes(self):
+        if sys.version_info[0] == 2:
+            raise SkipTest('bytes are not distinguished from str on Python 2')
+        msg, buffers = encode_binary({'data': b'png'})
+        content = json.loads(msg['__binary__'])
+        self.assertEqual(content, {'data': {'__buffer__': 0, 'dtype': 'bytes'}})
+        self.assertEqual(buffers[0].tobytes(), b'png')
+
+    def test_encode_strings_as_json(self):
+        msg, buffers = encode_binary({'type': 'scatter'})
+        self.assertEqual(json.loads(msg['__binary__']), {'type': 'scatter'})
+        self.assertEqual(buffers, [])
+
+    def test_encode_object_array_as_list(self):
+        msg, buffers = encode_binary({'x': np.array(['a', 'b'], dtype=object)})
+        self.assertEqual(json.loads(msg['__binary__']), {'x': ['a', 'b']})
+        self.assertEqual(buffers, [])
+
+
 
 @attr(optional=1)
 class TestJupyterComm(ComparisonTestCase):
@@ -2,7 +2,7 @@
 """
 Unit tests of the helper functions in core.utils
 """
-import sys, math
+import sys, math, numbers
 import unittest
 from unittest import SkipTest
 
@@ -16,7 +16,7 @@ except:
 
 from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
-    deephash, merge_dimensions, get_path, make_path_unique
+    deephash, merge_dimensions, get_path, make_path_unique, ContentHasher
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -136,6 +136,51 @@ class TestDeepHash(ComparisonTestCase):
         self.assertNotEqual(deephash(obj1), deephash(obj2))
 
 
+    def test_deephash_tuple_key_dict_equality(self):
+        self.assertEqual(deephash({(1, 2): 'a', (3, 4): 'b'}),
+                         deephash({(3, 4): 'b', (1, 2): 'a'}))
+
+    def test_deephash_tuple_key_dict_inequality(self):
+        self.assertNotEqual(deephash({(1, 2): 'a'}), deephash({(1, 3): 'a'}))
+
+    def test_deephash_numpy_dtype_inequality(self):
+        self.assertNotEqual(deephash(np.array([1,2,3], dtype='int32')),
+                            deephash(np.array([1,2,3], dtype='int64')))
+
+    def test_deephash_numpy_noncontiguous_equality(self):
+        arr = np.arange(10)
+        self.assertEqual(deephash(arr[::2]), deephash(np.array([0,2,4,6,8])))
+
+    def test_deephash_numpy_datetime_equality(self):
+        arr1 = np.array(['2017-01-01', '2017-01-02'], dtype='datetime64[ns]')
+        arr2 = np.array(['2017-01-01', '2017-01-02'], dtype='datetime64[ns]')
+        self.assertEqual(deephash(arr1), deephash(arr2))
+
+    def test_deephash_dataframe_column_inequality(self):
+        if pd is None: raise SkipTest
+        self.assertNotEqual(deephash(pd.DataFrame({'a':[1,2,3]})),
+                            deephash(pd.DataFrame({'b':[1,2,3]})))
+
+    def test_deephash_string_boundary_inequality(self):
+        self.assertNotEqual(deephash(['ab', 'c']), deephash(['a', 'bc']))
+
+    def test_content_hasher_custom_handler(self):
+        class Custom(object):
+            def __init__(self, value):
+                self.value = value
+        hasher = ContentHasher()
+        hasher.handlers = {Custom: lambda obj: obj.value}
+        self.assertEqual(hasher(Custom(1)), hasher(Custom(1)))
+        self.assertNotEqual(hasher(Custom(1)), hasher(Custom(2)))
+
+    def test_content_hasher_handlers_not_shared(self):
+        ContentHasher().handlers[int] = str
+        self.assertEqual(ContentHasher().handlers, {})
+
+    def test_deephash_returns_int(self):
+        self.assertIsInstance(deephash([1, 2, 3]), numbers.Integral)
+
+
 class TestAllowablePrefix(ComparisonTestCase):
     """
     Tests of allowable and hasprefix method.
@@ -106,6 +106,41 @@ class HomogeneousColumnTypes(object):
     def test_dataset_shape(self):
         self.assertEqual(self.dataset_hm.shape, (11, 2))
 
+    def test_dataset_range_cached(self):
+        self.assertEqual(self.dataset_hm.range('y'), (0, 20))
+        clone = self.dataset_hm.clone()
+        self.assertIs(clone._range_cache, self.dataset_hm._range_cache)
+        self.assertEqual(clone.range('y'), (0, 20))
+        selected = self.dataset_hm.select(x=(0, 5))
+        self.assertEqual(selected.range('y'), (0, 8))
+
+    def test_dataset_range_cache_invalidated_in_place(self):
+        dataset = Dataset({'x': np.arange(3), 'y': np.arange(3)},
+                          kdims=['x'], vdims=['y'], datatype=['dictionary'])
+        self.assertEqual(dataset.range('y'), (0, 2))
+        dataset.data['y'] = np.arange(3)*2
+        self.assertEqual(dataset.range('y'), (0, 4))
+
+    def test_dataset_range_cache_invalidated_dataframe_column(self):
+        try:
+            import pandas as pd
+        except ImportError:
+            raise SkipTest('Pandas not available')
+        df = pd.DataFrame({'x': np.arange(3), 'y': np.arange(3)})
+        dataset = Dataset(df, kdims=['x'], vdims=['y'], datatype=['dataframe'])
+        self.assertEqual(dataset.range('y'), (0, 2))
+        dataset.data['y'] = np.arange(3)*2.
+        self.assertEqual(dataset.range('y'), (0, 4))
+
+    def test_dataset_range_cache_not_shared_with_new_dims(self):
+        self.dataset_hm.range('y')
+        clone = self.dataset_hm.clone(vdims=[Dimension('y', label='Y')])
+        self.assertIsNot(clone._range_cache, self.dataset_hm._range_cache)
+
+    def test_dataset_select_set(self):
+        selected = self.dataset_hm.select(x={2, 5})
+        self.assertEqual(selected, Dataset(([2, 5], [4, 10]), kdims=['x'], vdims=['y']))
+
     def test_dataset_range(self):
         self.assertEqual(self.dataset_hm.range('y'), (0, 20))
 
@@ -629,6 +664,13 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
                           kdims=self.kdims, vdims=self.vdims)
         self.assertEquals(row, indexed)
 
+    def test_dataset_select_rows_gender_list(self):
+        row = self.table.select(Gender=['M', 'X'])
+        indexed = Dataset({'Gender':['M', 'M'], 'Age':[10, 16],
+                           'Weight':[15,18], 'Height':[0.8,0.6]},
+                          kdims=self.kdims, vdims=self.vdims)
+        self.assertEquals(row, indexed)
+
     def test_dataset_select_rows_gender_male_alias(self):
         row = self.alias_table.select(Gender='M')
         alias_row = self.alias_table.select(gender='M')
@@ -782,6 +824,22 @@ class ArrayDatasetTest(HomogeneousColumnTypes, ComparisonTestCase):
         self.data_instance_type = np.ndarray
         self.init_column_data()
 
+    def test_dataset_groupby_group_order(self):
+        ds = Dataset(np.column_stack([[3, 1, 3, 2, 1], np.arange(5)]),
+                     kdims=['x'], vdims=['y'])
+        grouped = ds.groupby('x', container_type=list)
+        self.assertEqual([k for k, _ in grouped], [(3,), (1,), (2,)])
+        self.assertEqual(grouped[0][1], Dataset([0, 2], vdims=['y']))
+
+    def test_dataset_aggregate_reductions(self):
+        ds = Dataset(np.column_stack([[3, 1, 3, 2, 1], [0, 1, 4, 3, 2]]),
+                     kdims=['x'], vdims=['y'])
+        for function, values in [(np.mean, [2, 1.5, 3]), (np.std, [2, 0.5, 0]),
+                                 (np.min, [0, 1, 3]), (len, [2, 2, 1])]:
+            aggregated = ds.aggregate('x', function)
+            self.assertEqual(aggregated, Dataset(np.column_stack([[3, 1, 2], values]),
+                                                 kdims=['x'], vdims=['y']))
+
     def test_dataset_simple_dict_sorted(self):
         dataset = Dataset({2: 2, 1: 1, 3: 3}, kdims=['x'], vdims=['y'])
         self.assertEqual(dataset, Dataset([(i, i) for i in range(1, 4)],
@@ -879,6 +937,31 @@ class DictDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
         self.data_instance_type = (dict, cyODict, OrderedDict)
         self.init_column_data()
 
+    def test_dataset_groupby_group_order(self):
+        ds = Dataset({'x': [3, 1, 3, 2, 1], 'y': np.arange(5)},
+                     kdims=['x'], vdims=['y'])
+        grouped = ds.groupby('x', container_type=list)
+        self.assertEqual([k for k, _ in grouped], [(3,), (1,), (2,)])
+        self.assertEqual(grouped[0][1], Dataset({'y': [0, 2]}, vdims=['y']))
+
+    def test_dataset_aggregate_reductions(self):
+        ds = Dataset({'x': [3, 1, 3, 2, 1], 'y': [0, 1, 4, 3, 2]},
+                     kdims=['x'], vdims=['y'])
+        for function, values in [(np.mean, [2, 1.5, 3]), (np.std, [2, 0.5, 0]),
+                                 (np.min, [0, 1, 3]), (len, [2, 2, 1])]:
+            aggregated = ds.aggregate('x', function)
+            self.assertEqual(aggregated, Dataset({'x': [3, 1, 2], 'y': values},
+                                                 kdims=['x'], vdims=['y']))
+
+    def test_multi_dimension_groupby(self):
+        x, y, z = list('AB'*10), np.arange(20)%3, np.arange(20)
+        ds = Dataset((x, y, z), kdims=['x', 'y'], vdims=['z'],  datatype=[self.datatype])
+        keys = [('A', 0), ('A', 1), ('A', 2), ('B', 0), ('B', 1), ('B', 2)]
+        grouped = ds.groupby(['x', 'y'])
+        self.assertEqual(grouped.keys(), keys)
+        group = Dataset({'z': [5, 11, 17]}, vdims=['z'])
+        self.assertEqual(grouped.last, group)
+
     def test_dataset_simple_dict_sorted(self):
         dataset = Dataset({2: 2, 1: 1, 3: 3}, kdims=['x'], vdims=['y'])
         self.assertEqual(dataset, Dataset([(i, i) for i in range(1, 4)],
@@ -190,4 +190,5 @@ class GraphBundlingTests(ComparisonTestCase):
 
     def test_directly_connect_paths(self):
         direct = directly_connect_edges(self.graph)._split_edgepaths
-        self.assertEqual(direct, self.graph.edgepaths)
+        graph = self.graph.clone((self.graph.data, self.graph.nodes, self.graph.edgepaths))
+        self.assertEqual(direct, graph._split_edgepaths)
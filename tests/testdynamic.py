@@ -1,14 +1,20 @@
 from collections import deque
 import time
 
+try:
+    from concurrent.futures import Future
+except ImportError:
+    Future = None
+
 import numpy as np
 from holoviews import Dimension, NdLayout, GridSpace, Layout
 from holoviews.core.spaces import DynamicMap, HoloMap, Callable
 from holoviews.element import Image, Scatter, Curve, Text, Points
 from holoviews.operation import histogram
-from holoviews.streams import Stream, PointerXY, PointerX, PointerY, RangeX
+from holoviews.streams import Stream, PointerXY, PointerX, PointerY, RangeX, Pipe
 from holoviews.util import Dynamic
 from holoviews.element.comparison import ComparisonTestCase
+from unittest import SkipTest
 
 
 XY = Stream.define('XY', x=0,y=0)
@@ -221,6 +227,48 @@ class DynamicMapMethods(ComparisonTestCase):
             dmap.reindex(['x'])
 
 
+class DynamicMapCache(ComparisonTestCase):
+
+    def test_dynamic_cache_lru_eviction(self):
+        dmap = DynamicMap(lambda i: Curve([i, i]), kdims=['i'], cache_size=3)
+        for i in [1, 2, 3, 1, 4]:
+            dmap[i]
+        self.assertEqual(dmap.keys(), [1, 3, 4])
+
+    def test_dynamic_cache_lfu_eviction(self):
+        dmap = DynamicMap(lambda i: Curve([i, i]), kdims=['i'], cache_size=3,
+                          cache_policy='lfu')
+        for i in [1, 1, 2, 3, 3, 4]:
+            dmap[i]
+        self.assertEqual(dmap.keys(), [1, 3, 4])
+
+    def test_dynamic_cache_bytes_eviction(self):
+        fn = lambda i: Curve(np.arange(10, dtype='float64'))
+        dmap = DynamicMap(fn, kdims=['i'], cache_bytes=320)
+        for i in range(4):
+            dmap[i]
+        self.assertEqual(dmap.keys(), [2, 3])
+        self.assertEqual(dmap.cache_stats['nbytes'], 320)
+
+    def test_dynamic_cache_bytes_retains_latest(self):
+        fn = lambda i: Curve(np.arange(10, dtype='float64'))
+        dmap = DynamicMap(fn, kdims=['i'], cache_bytes=1)
+        for i in range(3):
+            dmap[i]
+        self.assertEqual(dmap.keys(), [2])
+
+    def test_dynamic_cache_stats(self):
+        dmap = DynamicMap(lambda i: Curve([i, i]), kdims=['i'], cache_size=2)
+        for i in [0, 1, 0, 2, 0]:
+            dmap[i]
+        stats = dmap.cache_stats
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 3)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['size'], 2)
+
+
+
 class DynamicMapUnboundedProperty(ComparisonTestCase):
 
     def test_callable_bounded_init(self):
@@ -474,6 +522,69 @@ class DynamicCallableMemoize(ComparisonTestCase):
         self.assertEqual(dmap[()], Curve([1, 1, 1, 2, 2, 2]))
 
 
+    def test_dynamic_callable_memoize_size(self):
+        # Toggling between memoized states does not call the callback
+        def history_callback(x, history=deque(maxlen=10)):
+            history.append(x)
+            return Curve(list(history))
+
+        x = PointerX()
+        callable_obj = Callable(history_callback, memoize_size=2)
+        dmap = DynamicMap(callable_obj, kdims=[], streams=[x])
+
+        # Add stream subscriber mocking plot
+        x.add_subscriber(lambda **kwargs: dmap[()])
+
+        for i in [1, 2, 1, 2]:
+            x.event(x=i)
+        self.assertEqual(dmap[()], Curve([1, 2]))
+
+        x.event(x=3)
+        x.event(x=1)
+        self.assertEqual(dmap[()], Curve([1, 2, 3, 1]))
+
+    def test_dynamic_callable_pipe_resend(self):
+        # Resending data on a Pipe always calls the callback
+        calls = []
+        def callback(data):
+            calls.append(data)
+            return Curve(data)
+
+        pipe = Pipe(data=[1, 2])
+        dmap = DynamicMap(callback, streams=[pipe])
+        pipe.add_subscriber(lambda **kwargs: dmap[()])
+        pipe.send([1, 2])
+        pipe.send([1, 2])
+        self.assertEqual(calls, [[1, 2]]*2)
+
+    def test_dynamic_callable_pipe_memoize(self):
+        # Hashing Pipe data memoizes identical data
+        calls = []
+        def callback(data):
+            calls.append(data)
+            return Curve(data)
+
+        pipe = Pipe(data=[1, 2], memoize=True)
+        dmap = DynamicMap(callback, streams=[pipe])
+        pipe.add_subscriber(lambda **kwargs: dmap[()])
+        pipe.send([1, 2])
+        pipe.send([1, 2])
+        pipe.send([3, 4])
+        self.assertEqual(calls, [[1, 2], [3, 4]])
+
+    def test_callable_clone_shares_memoized(self):
+        calls = []
+        def fn(x):
+            calls.append(x)
+            return Curve([x, x])
+        callable_obj = Callable(fn, memoize_size=2)
+        callable_obj(x=1)
+        callable_obj.clone()(x=1)
+        self.assertEqual(calls, [1])
+        callable_obj.clone(callable=lambda x: fn(x))(x=1)
+        self.assertEqual(calls, [1, 1])
+
+
 class StreamSubscribersAddandClear(ComparisonTestCase):
 
     def setUp(self):
@@ -751,3 +862,81 @@ class DynamicCollate(ComparisonTestCase):
         self.assertEqual(list(grid.keys()), [(i, j) for i in range(1, 3)
                                              for j in range(1, 3)])
         self.assertEqual(stream.source, grid[(1, 2)])
+
+
+
+class DeferredExecutor(object):
+    """
+    Executor which only evaluates submitted functions when run is called.
+    """
+
+    def __init__(self):
+        self.queue = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.queue.append((future, fn, args, kwargs))
+        return future
+
+    def run(self):
+        queue, self.queue = self.queue, []
+        for future, fn, args, kwargs in queue:
+            if future.set_running_or_notify_cancel():
+                future.set_result(fn(*args, **kwargs))
+
+
+class DynamicMapAsync(ComparisonTestCase):
+
+    def setUp(self):
+        if Future is None:
+            raise SkipTest('concurrent.futures not available')
+        self.executor = DeferredExecutor()
+        self.calls = []
+        self.refreshed = []
+        self.stream = PointerX(x=0)
+        def callback(x):
+            self.calls.append(x)
+            return Curve([x, x])
+        self.dmap = DynamicMap(callback, streams=[self.stream],
+                               executor=self.executor)
+        # Add internal stream subscriber mocking plot
+        self.stream.add_subscriber(lambda **kwargs: self.refreshed.append(self.dmap[()]), 2)
+
+    def test_async_initial_evaluation_synchronous(self):
+        self.assertEqual(self.dmap[()], Curve([0, 0]))
+        self.assertEqual(self.executor.queue, [])
+
+    def test_async_event_returns_stale_element(self):
+        self.dmap[()]
+        self.stream.event(x=1)
+        self.assertEqual(self.refreshed, [Curve([0, 0])])
+        self.assertEqual(len(self.executor.queue), 1)
+
+    def test_async_event_refreshes_when_ready(self):
+        self.dmap[()]
+        self.stream.event(x=1)
+        self.executor.run()
+        self.assertEqual(self.refreshed, [Curve([0, 0]), Curve([1, 1])])
+
+    def test_async_latest_event_wins(self):
+        self.dmap[()]
+        self.stream.event(x=1)
+        self.stream.event(x=2)
+        self.executor.run()
+        self.assertEqual(self.calls, [0, 2])
+        self.assertEqual(self.refreshed[-1], Curve([2, 2]))
+
+    def test_async_transient_events_not_memoized(self):
+        stream = Stream.define('Clicks', x=0)(transient=True)
+        dmap = DynamicMap(lambda x: self.calls.append(x) or Curve([x, x]),
+                          streams=[stream], executor=self.executor)
+        dmap[()]
+        stream.event(x=1)
+        self.executor.run()
+        stream.event(x=1)
+        self.executor.run()
+        self.assertEqual(self.calls, [0, 1, 1])
+
+    def test_async_invalid_executor(self):
+        with self.assertRaises(ValueError):
+            DynamicMap(lambda x: Curve([x]), streams=[PointerX()], executor='foo')
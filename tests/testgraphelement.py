@@ -2,7 +2,7 @@
 Unit tests of Graph Element.
 """
 import numpy as np
-from holoviews.element.graphs import Graph, Nodes, circular_layout
+from holoviews.element.graphs import Graph, Nodes, EdgePaths, circular_layout
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -38,6 +38,51 @@ class GraphTests(ComparisonTestCase):
         with self.assertRaisesRegexp(ValueError, exception):
             graph = Graph(((self.source, self.target), self.nodes, paths.redim(x='x2')))
 
+    def test_edgepaths_connect_nodes(self):
+        graph = Graph(((self.source, self.target), self.nodes))
+        edges = graph.edgepaths.split()
+        self.assertEqual(len(edges), 1)
+        xs, ys, _ = self.nodes
+        expected = [[(xs[s], ys[s]), (xs[0], ys[0])] for s in self.source]
+        self.assertEqual(graph._split_edgepaths.split(),
+                         EdgePaths(expected).split())
+
+    def test_edgepaths_cached(self):
+        graph = Graph(((self.source, self.target), self.nodes))
+        self.assertIs(graph.edgepaths, graph.edgepaths)
+
+    def test_edgepaths_missing_node(self):
+        graph = Graph(((self.source, self.target+10), self.nodes))
+        with self.assertRaisesRegexp(ValueError, 'Could not find node positions'):
+            graph.edgepaths
+
+    def test_select_reuses_edgepaths(self):
+        graph = Graph(((self.source, self.source[::-1]), self.nodes))
+        graph.edgepaths
+        selection = graph.select(start=(2, 6))
+        self.assertIsNot(selection._computed_edgepaths, None)
+        expected = Graph((selection.data, selection.nodes)).edgepaths
+        self.assertEqual(selection.edgepaths, expected)
+
+    def test_node_edges(self):
+        graph = Graph(((self.source, self.source+1), self.nodes))
+        self.assertEqual(graph.node_edges([2, 4]), np.array([1, 2, 3, 4]))
+
+    def test_node_edges_induced(self):
+        graph = Graph(((self.source, self.source+1), self.nodes))
+        self.assertEqual(graph.node_edges([2, 3, 5], induced=True), np.array([2]))
+
+    def test_node_edges_missing_node(self):
+        graph = Graph(((self.source, self.source+1), self.nodes))
+        self.assertEqual(graph.node_edges([7, 10]), np.array([6, 7]))
+
+    def test_clone_edge_index(self):
+        graph = Graph(((self.source, self.source+1), self.nodes))
+        graph.node_edges([0])
+        self.assertIs(graph.clone()._edge_index, graph._edge_index)
+        self.assertIs(graph.clone(graph.data)._edge_index, None)
+        self.assertIs(graph.clone(kdims=['src', 'tgt'])._edge_index, None)
+
     def test_select_by_node_in_edges_selection_mode(self):
         graph = Graph(((self.source, self.target),))
         selection = Graph(([(1, 0), (2, 0)], list(zip(*self.nodes))[0:3]))
@@ -0,0 +1,30 @@
+"""
+Regression tests ensuring optional dependencies are not imported
+when importing holoviews.
+"""
+import sys
+import subprocess
+from unittest import SkipTest
+
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class TestImports(ComparisonTestCase):
+
+    deferred = ['IPython', 'xarray', 'iris', 'dask', 'seaborn']
+
+    def test_import_defers_optional_dependencies(self):
+        if sys.version_info < (3, 5):
+            raise SkipTest('Optional interfaces are imported eagerly on Python 2')
+        code = ("import sys, holoviews; print(','.join(m for m in %r if m in sys.modules))"
+                % self.deferred)
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.decode('utf-8').strip(), '')
+
+    def test_optional_interface_api_import(self):
+        try:
+            import xarray # noqa (Availability import)
+        except ImportError:
+            raise SkipTest('xarray not available')
+        from holoviews.core.data import XArrayInterface
+        self.assertEqual(XArrayInterface.datatype, 'xarray')
@@ -1,3 +1,4 @@
+import pickle
 from collections import OrderedDict
 
 from holoviews.core import Dimension
@@ -120,6 +121,42 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap = NdMapping(self.init_item_odict, kdims=[self.dim1, self.dim2])
         self.assertEqual(ndmap[:, 0.0:3.0].keys(), [(1, 2.0)])
 
+    def test_ndmapping_slice_large(self):
+        ndmap = NdMapping([((i, i % 3), i) for i in range(1000)],
+                          kdims=[self.dim1, self.dim2])
+        self.assertEqual(ndmap[100:103, :].keys(),
+                         [(100, 1.0), (101, 2.0), (102, 0.0)])
+        self.assertEqual(ndmap[100:110, 1.0].keys(),
+                         [(100, 1.0), (103, 1.0), (106, 1.0), (109, 1.0)])
+
+    def test_ndmapping_slice_set_and_list(self):
+        ndmap = NdMapping([((i, i % 3), i) for i in range(1000)],
+                          kdims=[self.dim1, self.dim2])
+        self.assertEqual(ndmap[[5, 3, 999], [0.0, 2.0]].keys(),
+                         [(3, 0.0), (5, 2.0), (999, 0.0)])
+
+    def test_ndmapping_slice_updated_after_insert(self):
+        ndmap = NdMapping(self.init_item_odict, kdims=[self.dim1, self.dim2])
+        self.assertEqual(ndmap[0:4, :].keys(), [(1, 2.0)])
+        ndmap[(2, 1.0)] = 'c'
+        self.assertEqual(ndmap[0:4, :].keys(), [(1, 2.0), (2, 1.0)])
+        ndmap.pop((1, 2.0))
+        self.assertEqual(ndmap[0:4, :].keys(), [(2, 1.0)])
+
+    def test_ndmapping_slice_string_keys(self):
+        ndmap = NdMapping([('A', 1), ('B', 2), ('C', 3)], kdims=['Letter'])
+        self.assertEqual(ndmap['A':'C'].keys(), ['A', 'B'])
+        self.assertEqual(ndmap[['C', 'A']].keys(), ['A', 'C'])
+
+    def test_ndmapping_slice_categorical_values(self):
+        dim = Dimension('Letter', values=['C', 'B', 'A'])
+        ndmap = NdMapping([('A', 1), ('B', 2), ('C', 3)], kdims=[dim])
+        self.assertEqual(ndmap['C':'A'].keys(), ['C', 'B'])
+
+    def test_ndmapping_slice_mixed_keys(self):
+        ndmap = NdMapping([(1, 1), ('B', 2), (None, 3)], kdims=['Mixed'], sort=False)
+        self.assertEqual(ndmap[[1, 'B']].keys(), [1, 'B'])
+
     def test_idxmapping_unsorted(self):
         data = [('B', 1), ('C', 2), ('A', 3)]
         ndmap = MultiDimensionalMapping(data, sort=False)
@@ -137,6 +174,30 @@ class NdIndexableMappingTest(ComparisonTestCase):
         self.assertEquals(grouped.values()[0].keys(), ['A'])
         self.assertEquals(grouped.last.keys(), ['B', 'C'])
 
+    def test_idxmapping_setitem_sorted(self):
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1])
+        for k in [3, 1, 2]:
+            ndmap[k] = str(k)
+        self.assertEquals(ndmap.keys(), [1, 2, 3])
+        ndmap[0] = '0'
+        self.assertEquals(ndmap.last, '3')
+        self.assertEquals(list(ndmap.data.keys()), [(0,), (1,), (2,), (3,)])
+
+    def test_idxmapping_setitem_unsorted(self):
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1], sort=False)
+        for k in [3, 1, 2]:
+            ndmap[k] = str(k)
+        self.assertEquals(ndmap.keys(), [3, 1, 2])
+
+    def test_idxmapping_setitem_pickle_sorted(self):
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1])
+        for k in [3, 1, 2]:
+            ndmap[k] = str(k)
+        unpickled = pickle.loads(pickle.dumps(ndmap))
+        self.assertEquals(unpickled.keys(), [1, 2, 3])
+        unpickled[0] = '0'
+        self.assertEquals(unpickled.keys(), [0, 1, 2, 3])
+
     def test_idxmapping_reindex(self):
         data = [((0, 0.5), 'a'), ((1, 0.5), 'b')]
         ndmap = MultiDimensionalMapping(data, kdims=[self.dim1, self.dim2])
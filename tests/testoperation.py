@@ -38,6 +38,22 @@ class OperationTests(ComparisonTestCase):
         op_hmap = operation(hmap, op=lambda x, k: x.clone(x.data*2))
         self.assertEqual(op_hmap.last, hmap.last.clone(hmap.last.data*2, group='Operation'))
 
+    def test_operation_holomap_threads(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(10)})
+        op_hmap = operation(hmap, op=lambda x, k: x.clone(x.data*2), executor='threads')
+        doubled = hmap.clone({k: v.clone(v.data*2, group='Operation')
+                              for k, v in hmap.items()})
+        self.assertEqual(op_hmap, doubled)
+
+    def test_operation_holomap_threads_error_first_key(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(10)})
+        def op(x, k):
+            if k >= 3:
+                raise ValueError(k)
+            return x
+        with self.assertRaisesRegexp(ValueError, '3'):
+            operation(hmap, op=op, executor='threads')
+
     def test_image_transform(self):
         img = Image(np.random.rand(10, 10))
         op_img = transform(img, operator=lambda x: x*2)
@@ -179,6 +179,26 @@ class TestOptionTree(ComparisonTestCase):
         self.assertEqual(options.MyType['group2'], opts2)
         self.assertEqual(options.MyType['group2'].options, {'kw2':'value2'})
 
+    def test_optiontree_setter_bumps_version(self):
+        options = OptionTree(groups=['group1', 'group2'])
+        version = Store.options_version
+        options.MyType = Options('group1', kw1='value')
+        self.assertTrue(Store.options_version > version)
+
+    def test_optiontree_closest_cached(self):
+        if 'matplotlib' not in Store.renderers:
+            raise SkipTest("Closest option lookup requires matplotlib")
+
+        options = OptionTree(groups=['style'])
+        options.Histogram = Options('style', kw1='value1')
+        hist = Histogram(([1, 2], [0, 1, 2]))
+        self.assertEqual(options.closest(hist, 'style').kwargs['kw1'], 'value1')
+        self.assertEqual(options.closest(hist, 'style').kwargs['kw1'], 'value1')
+        self.assertEqual(options.cache_stats, dict(hits=1, misses=1, size=1))
+
+        options.Histogram = Options('style', kw1='value2')
+        self.assertEqual(options.closest(hist, 'style').kwargs['kw1'], 'value2')
+
     def test_optiontree_inheritance(self):
         if 'matplotlib' not in Store.renderers:
             raise SkipTest("General to specific option test requires matplotlib")
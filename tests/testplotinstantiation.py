@@ -21,7 +21,7 @@ from holoviews.element import (Curve, Scatter, Image, VLine, Points,
                                Scatter3D, Path, Polygons, Bars, Text,
                                BoxWhisker, HLine, RGB)
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.streams import Stream, PointerXY, PointerX
+from holoviews.streams import Stream, PointerXY, PointerX, Buffer
 from holoviews.operation import gridmatrix
 from holoviews.plotting import comms
 from holoviews.plotting.util import rgb2hex
@@ -400,6 +400,26 @@ class TestBokehPlotInstantiation(ComparisonTestCase):
         self.assertEqual(source.data['image'][0].mean(), 2)
         self.assertIn(source, plot.current_handles)
 
+    def test_buffer_stream_updates_source(self):
+        buff = Buffer({'x': np.arange(3), 'y': np.arange(3)}, length=4)
+        dmap = DynamicMap(lambda data: Curve(data), streams=[buff])
+        plot = bokeh_renderer.get_plot(dmap, doc=Document())
+        source = plot.handles['source']
+        buff.send({'x': [3, 4], 'y': [3, 4]})
+        self.assertEqual(np.asarray(source.data['x']), np.arange(1, 5))
+        self.assertEqual(np.asarray(source.data['y']), np.arange(1, 5))
+
+    def test_buffer_stream_transformed_data_replaces_source(self):
+        buff = Buffer({'x': np.arange(3.), 'y': np.arange(3.)}, length=4)
+        def normalize(data):
+            return Curve((data['x'], data['y']/data['y'].max()))
+        dmap = DynamicMap(normalize, streams=[buff])
+        plot = bokeh_renderer.get_plot(dmap, doc=Document())
+        source = plot.handles['source']
+        buff.send({'x': [3., 4.], 'y': [3., 4.]})
+        self.assertEqual(np.asarray(source.data['x']), np.arange(1., 5.))
+        self.assertEqual(np.asarray(source.data['y']), np.arange(1., 5.)/4.)
+
     def test_static_source_optimization(self):
         global data
         data = np.ones((5, 5))
@@ -1,12 +1,16 @@
 from unittest import SkipTest
+
+import numpy as np
 from nose.plugins.attrib import attr
 
 from holoviews import NdOverlay, Overlay
 from holoviews.core.spaces import DynamicMap
 from holoviews.core.options import Store
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.element import Curve, Area
-from holoviews.plotting.util import compute_overlayable_zorders
+from holoviews.element import Curve, Area, Points
+from holoviews.plotting.util import (compute_overlayable_zorders,
+                                     get_min_distance, _sweep_min_distance,
+                                     map_colors, rgba_to_hex)
 from holoviews.streams import PointerX
 
 try:
@@ -302,6 +306,54 @@ class TestPlotUtils(ComparisonTestCase):
 
 
 
+class TestMinDistance(ComparisonTestCase):
+
+    def test_min_distance_regular_grid(self):
+        xs, ys = np.meshgrid(np.arange(0, 10, 2.), np.arange(0, 5, 0.5))
+        points = Points((xs.flatten(), ys.flatten()))
+        self.assertEqual(get_min_distance(points), 0.5)
+
+    def test_min_distance_scattered(self):
+        points = Points([(0, 0), (3, 4), (3, 4), (10, 1), (2, 7)])
+        self.assertAlmostEqual(get_min_distance(points), np.hypot(1, 3))
+
+    def test_min_distance_sweep_matches_pairwise(self):
+        xys = np.random.RandomState(1).rand(200, 2)
+        dists = np.hypot(*(xys[:, None, :]-xys[None, :, :]).T)
+        np.fill_diagonal(dists, np.inf)
+        self.assertAlmostEqual(_sweep_min_distance(xys), dists.min())
+
+
+class TestMapColors(ComparisonTestCase):
+
+    def setUp(self):
+        try:
+            from matplotlib.colors import ListedColormap
+        except:
+            raise SkipTest("Colormapping tests require matplotlib")
+        self.cmap = ListedColormap(['#000000', '#ff0000', '#00ff00', '#0000ff'])
+
+    def test_rgba_to_hex(self):
+        rgba = np.array([[0, 15, 255, 255], [171, 205, 239, 0]], dtype=np.uint8)
+        self.assertEqual(list(rgba_to_hex(rgba)), ['#000fff', '#abcdef'])
+
+    def test_map_colors_hex(self):
+        colors = map_colors(np.array([0, 0.3, 0.6, 1]), (0, 1), self.cmap)
+        self.assertEqual(colors, ['#000000', '#ff0000', '#00ff00', '#0000ff'])
+
+    def test_map_colors_matches_cmap(self):
+        values = np.array([-1, 0, 0.2, np.nan, 0.99, 2])
+        colors = map_colors(values, (0, 1), self.cmap, hex=False)
+        self.assertEqual(colors, self.cmap(np.ma.masked_invalid(values)))
+
+    def test_map_colors_uint32(self):
+        colors = map_colors(np.array([0, 1]), (0, 1), self.cmap, hex='uint32')
+        self.assertEqual(colors.dtype, np.uint32)
+        self.assertEqual(colors.view(np.uint8).reshape(2, 4),
+                         np.array([[0, 0, 0, 255], [0, 0, 255, 255]], dtype=np.uint8))
+
+
+
 @attr(optional=1)  # Flexx is optional
 class TestBokehUtils(ComparisonTestCase):
 
@@ -4,7 +4,12 @@ Test cases for rendering exporters
 """
 from __future__ import unicode_literals
 
+import os
+import json
+import shutil
+import tempfile
 from io import BytesIO
+from distutils.spawn import find_executable
 from unittest import SkipTest
 from nose.plugins.attrib import attr
 import numpy as np
@@ -15,6 +20,7 @@ from holoviews.plotting import Renderer
 
 try:
     # Standardize backend due to random inconsistencies
+    import matplotlib as mpl
     from matplotlib import pyplot
     from holoviews.plotting.mpl import MPLRenderer
     pyplot.switch_backend('agg')
@@ -65,6 +71,39 @@ class MPLRendererTest(ComparisonTestCase):
 
         self.renderer = MPLRenderer.instance()
 
+    def test_widget_parallel_frames(self):
+        progress = []
+        widget = self.renderer.get_widget(self.map1, 'widgets', processes=2,
+                                          progress=lambda *args: progress.append(args))
+        frames = json.loads(widget.get_frames())
+        self.assertEqual(sorted(frames.keys()), ['0', '1'])
+        self.assertEqual([p[:2] for p in progress], [(1, 2), (2, 2)])
+
+    def test_widget_stream_json_frames(self):
+        path = tempfile.mkdtemp()
+        try:
+            widget = self.renderer.get_widget(self.map1, 'widgets', export_json=True,
+                                              json_frames=True, json_save_path=path)
+            self.assertEqual(widget.get_frames(), '{}')
+            frame_dir = os.path.join(path, widget.id)
+            self.assertEqual(sorted(os.listdir(frame_dir)), ['0.json', '1.json'])
+        finally:
+            shutil.rmtree(path)
+
+    def test_widget_json_frames_requires_save_path(self):
+        with self.assertRaises(ValueError):
+            widget = self.renderer.get_widget(self.map1, 'widgets', export_json=True,
+                                              json_frames=True, json_save_path=None)
+            widget.get_frames()
+
+    def test_render_gif_parallel(self):
+        if find_executable(mpl.rcParams['animation.convert_path']) is None:
+            raise SkipTest("ImageMagick required to test gif export")
+        renderer = self.renderer.instance(processes=2)
+        data, info = renderer(self.map1, fmt='gif')
+        self.assertEqual(info['file-ext'], 'gif')
+        self.assertTrue(data.startswith(b'GIF'))
+
     def test_get_size_single_plot(self):
         plot = self.renderer.get_plot(self.image1)
         w, h = self.renderer.get_size(plot)
@@ -2,8 +2,10 @@
 Unit test of the streams system
 """
 from collections import defaultdict
+from functools import partial
 
 import param
+import numpy as np
 from holoviews.element import Points
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.streams import * # noqa (Test all available streams)
@@ -324,3 +326,151 @@ class TestPlotSizeTransform(ComparisonTestCase):
         plotsize.event(width=600, height=100)
         self.assertEqual(plotsize.contents, {'width':1200, 'height':200, 'scale':2})
 
+
+
+class TestBufferStream(ComparisonTestCase):
+
+    def test_buffer_send_appends_rows(self):
+        buff = Buffer({'x': np.arange(3), 'y': np.arange(3)*2})
+        buff.send({'x': [3, 4], 'y': [6, 8]})
+        self.assertEqual(buff.data['x'], np.arange(5))
+        self.assertEqual(buff.data['y'], np.arange(5)*2)
+
+    def test_buffer_send_rolls_over_length(self):
+        buff = Buffer({'x': np.arange(3)}, length=4)
+        buff.send({'x': [3, 4]})
+        self.assertEqual(buff.data['x'], np.arange(1, 5))
+
+    def test_buffer_length_parameter(self):
+        buff = Buffer({'x': np.arange(3)}, length=4)
+        self.assertEqual(list(buff.contents), ['data'])
+        self.assertIn('length=4', repr(buff))
+        self.assertEqual(buff.rename(data='y').length, 4)
+
+    def test_buffer_chunk_size_during_event(self):
+        buff = Buffer({'x': np.arange(3)})
+        sizes = []
+        buff.add_subscriber(lambda **kwargs: sizes.append(buff.chunk_size))
+        buff.send({'x': [3, 4]})
+        self.assertEqual(sizes, [2])
+        self.assertEqual(buff.chunk_size, None)
+
+    def test_buffer_send_column_mismatch(self):
+        buff = Buffer({'x': np.arange(3)})
+        with self.assertRaises(ValueError):
+            buff.send({'y': [3]})
+
+
+class TestPipeStream(ComparisonTestCase):
+
+    def test_pipe_send(self):
+        pipe = Pipe()
+        received = []
+        pipe.add_subscriber(lambda data: received.append(data))
+        pipe.send([1, 2, 3])
+        self.assertEqual(received, [[1, 2, 3]])
+        self.assertEqual(pipe.data, [1, 2, 3])
+
+    def test_pipe_send_coalesces_pending_data(self):
+        pipe = Pipe()
+        received = []
+        def subscriber(data):
+            received.append(data)
+            if data == 0:
+                # Data sent during an ongoing update is coalesced
+                pipe.send(1)
+                pipe.send(2)
+        pipe.add_subscriber(subscriber)
+        pipe.send(0)
+        self.assertEqual(received, [0, 2])
+        self.assertEqual(pipe.data, 2)
+
+    def test_pipe_hashkey_by_reference(self):
+        pipe = Pipe(data=[1, 2, 3])
+        key = pipe.hashkey
+        pipe.send([1, 2, 3])
+        self.assertNotEqual(pipe.hashkey, key)
+
+
+class TestThrottle(ComparisonTestCase):
+
+    def setUp(self):
+        self.scheduled = []
+        self.calls = []
+
+    def schedule(self, fn, delay):
+        self.scheduled.append(fn)
+
+    def test_throttle_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            Throttle(1, policy='foo')
+
+    def test_throttle_leading_drops_events(self):
+        throttle = Throttle(10, policy='leading', schedule=self.schedule)
+        for i in range(3):
+            throttle(lambda i=i: self.calls.append(i))
+        self.assertEqual(self.calls, [0])
+        self.assertEqual(self.scheduled, [])
+        self.assertEqual(throttle.stats, {'calls': 3, 'triggered': 1, 'dropped': 2})
+
+    def test_throttle_max_rate_defers_latest_event(self):
+        throttle = Throttle(10, policy='max-rate', schedule=self.schedule)
+        for i in range(4):
+            throttle(lambda i=i: self.calls.append(i))
+        self.assertEqual(self.calls, [0])
+        self.assertEqual(len(self.scheduled), 1)
+        self.scheduled[0]()
+        self.assertEqual(self.calls, [0, 3])
+        self.assertEqual(throttle.stats, {'calls': 4, 'triggered': 2, 'dropped': 2})
+
+    def test_throttle_trailing_invokes_last_event(self):
+        throttle = Throttle(0, policy='trailing', schedule=self.schedule)
+        for i in range(3):
+            throttle(lambda i=i: self.calls.append(i))
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(self.scheduled), 1)
+        self.scheduled[0]()
+        self.assertEqual(self.calls, [2])
+        self.assertEqual(throttle.stats, {'calls': 3, 'triggered': 1, 'dropped': 2})
+
+    def test_throttle_default_schedule_on_loop(self):
+        class Loop(object):
+            _running = True
+            def __init__(self):
+                self.callbacks = []
+            def add_callback(self, fn, *args):
+                self.callbacks.append(partial(fn, *args))
+            def call_later(self, delay, fn):
+                fn()
+        throttle = Throttle(10, policy='max-rate')
+        throttle._loop = loop = Loop()
+        for i in range(2):
+            throttle(lambda i=i: self.calls.append(i))
+        self.assertEqual(self.calls, [0])
+        self.assertEqual(len(loop.callbacks), 1)
+        loop.callbacks[0]()
+        self.assertEqual(self.calls, [0, 1])
+
+    def test_throttle_default_schedule_without_loop(self):
+        throttle = Throttle(0.01, policy='max-rate')
+        for i in range(2):
+            throttle(lambda i=i: self.calls.append(i))
+        self.assertEqual(self.calls, [0, 1])
+
+    def test_stream_throttle_stats(self):
+        throttle = Throttle(10, policy='leading', schedule=self.schedule)
+        stream = PointerX(x=0, throttle=throttle)
+        stream.add_subscriber(lambda x: self.calls.append(x))
+        for i in range(3):
+            stream.event(x=i)
+        self.assertEqual(self.calls, [0])
+        self.assertEqual(stream.x, 2)
+        self.assertEqual(stream.stats, {'calls': 3, 'triggered': 1, 'dropped': 2})
+
+    def test_stream_throttle_interval(self):
+        stream = PointerX(throttle=0.5)
+        self.assertEqual(stream.throttle.interval, 0.5)
+        self.assertEqual(stream.throttle.policy, 'max-rate')
+
+    def test_stream_without_throttle_stats(self):
+        self.assertEqual(PointerX().stats, None)